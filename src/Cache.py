@@ -0,0 +1,71 @@
+import hashlib
+import marshal
+import os
+
+MAGIC = b"PYDSL\x01"
+SOURCES = ["Regex.py", "Lexer.py", "Parser.py", "DSL.py", "Cache.py"]
+
+_version = None
+def version():
+    global _version
+    if _version is None:
+        digest = hashlib.sha256()
+        base = os.path.dirname(os.path.abspath(__file__))
+        for name in SOURCES:
+            with open(os.path.join(base, name), "rb") as source:
+                digest.update(source.read())
+        _version = digest.hexdigest()
+    return _version
+
+def cacheDir(cache):
+    if cache is False:
+        return None
+    if cache is None or cache is True:
+        default = os.path.expanduser("~/.cache/pydsl") if cache else None
+        return os.environ.get("PYDSL_CACHE_DIR", default)
+    return cache
+
+def load(path, key):
+    try:
+        with open(path, "rb") as cacheFile:
+            data = cacheFile.read()
+    except OSError:
+        return None
+    header, checksum, payload = data[:len(MAGIC)], data[len(MAGIC):len(MAGIC)+32], data[len(MAGIC)+32:]
+    if header != MAGIC or hashlib.sha256(payload).digest() != checksum:
+        return None
+    try:
+        storedKey, tables = marshal.loads(payload)
+    except (EOFError, ValueError, TypeError):
+        return None
+    return tables if storedKey == key else None
+
+def store(path, key, tables):
+    payload = marshal.dumps((key, tables))
+    tmpPath = "{0}.{1}.tmp".format(path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmpPath, "wb") as cacheFile:
+            cacheFile.write(MAGIC + hashlib.sha256(payload).digest() + payload)
+        os.replace(tmpPath, path)
+    except OSError:
+        if os.path.exists(tmpPath):
+            os.remove(tmpPath)
+
+def cached(key, build, fromTables, cache=None):
+    directory = cacheDir(cache)
+    if directory is None:
+        return build()
+
+    key = key + (version(),)
+    path = os.path.join(directory, hashlib.sha256(marshal.dumps(key)).hexdigest() + ".pydsl")
+    tables = load(path, key)
+    if tables is not None:
+        try:
+            return fromTables(tables)
+        except (LookupError, TypeError, ValueError):
+            pass
+
+    obj = build()
+    store(path, key, obj.toTables())
+    return obj
@@ -1,78 +1,9 @@
+import os
+
+import Cache
 import Lexer
 import Parser
 
-_lexerLexer = Lexer.Lexer([
-    Lexer.Rule("::=", "::=", isRegex=False),
-    Lexer.Rule("%keys", "%keys", isRegex=False),
-    Lexer.Rule("%ignore", "%ignore", isRegex=False),
-    Lexer.Rule("comment", "#[^\n]*\n"),
-    Lexer.Rule("identifier", "[_a-zA-Z][_a-zA-Z0-9]*"),
-    Lexer.Rule("sqString", "'[^']*'"),
-    Lexer.Rule("dqString", "\"[^\"\\]*(\\\\.[^\"\\]*)*\""),
-    Lexer.Rule("reString", "/[^/\\]*(\\\\.[^/\\]*)*/"),
-], ignore=["comment"])
-_lexerParser = Parser.EarleyParser("LexRules", [
-    Parser.Rule("LexRules", ["rules"]),
-    Parser.Rule("rules", []),
-    Parser.Rule("rules", ["rule", "rules"]),
-    Parser.Rule("rule", ["identifier", "::=", "sqString"]),
-    Parser.Rule("rule", ["identifier", "::=", "dqString"]),
-    Parser.Rule("rule", ["identifier", "::=", "reString"]),
-    Parser.Rule("rule", ["%keys", "::=", "keys"]),
-    Parser.Rule("rule", ["%ignore", "::=", "elements"]),
-    Parser.Rule("keys", ["key"]),
-    Parser.Rule("keys", ["key", "keys"]),
-    Parser.Rule("key", ["sqString"]),
-    Parser.Rule("key", ["dqString"]),
-    Parser.Rule("elements", ["element"]),
-    Parser.Rule("elements", ["element", "elements"]),
-    Parser.Rule("element", ["identifier"]),
-    Parser.Rule("element", ["sqString"]),
-    Parser.Rule("element", ["dqString"]),
-], expand=["rules", "keys", "key", "element", "elements"], ignore=["::="])
-
-_parserLexer = Lexer.Lexer([
-    Lexer.Rule("$", "$", isRegex=False),
-    Lexer.Rule("|", "|", isRegex=False),
-    Lexer.Rule("(", "(", isRegex=False),
-    Lexer.Rule(")", ")", isRegex=False),
-    Lexer.Rule("$", "$", isRegex=False),
-    Lexer.Rule("+", "+", isRegex=False),
-    Lexer.Rule("*", "*", isRegex=False),
-    Lexer.Rule("?", "?", isRegex=False),
-    Lexer.Rule("::=", "::=", isRegex=False),
-    Lexer.Rule("configType", "%(ignore|expandSingle|expand)"),
-    Lexer.Rule("identifier", "[_a-zA-Z][_a-zA-Z0-9]*"),
-    Lexer.Rule("sqString", "'[^']*'"),
-    Lexer.Rule("dqString", "\"[^\"\\]*(\\.[^\"\\]*)*\""),
-    Lexer.Rule("comment", "#[^\n]*\n"),
-], ignore=["comment"])
-_parserParser = Parser.EarleyParser('ParseRules', [
-    Parser.Rule('ParseRules', ['rules']),
-    Parser.Rule('rules', []),
-    Parser.Rule('rules', ['rule', 'rules']),
-    Parser.Rule('rule', ['identifier', '::=', 'alternates']),
-    Parser.Rule('rule', ['configType', '::=', 'simpleItems']),
-    Parser.Rule('alternates', ['alternate']),
-    Parser.Rule('alternates', ['alternate', '|', 'alternates']),
-    Parser.Rule('alternate', ['$']),
-    Parser.Rule('alternate', ['rhsItems']),
-    Parser.Rule('rhsItems', ['rhsItem']),
-    Parser.Rule('rhsItems', ['rhsItem', 'rhsItems']),
-    Parser.Rule('rhsItem', ['itemValue', 'decorator']),
-    Parser.Rule('itemValue', ['simpleItem']),
-    Parser.Rule('itemValue', ['(', 'alternates', ')']),
-    Parser.Rule('decorator', []),
-    Parser.Rule('decorator', ['?']),
-    Parser.Rule('decorator', ['+']),
-    Parser.Rule('decorator', ['*']),
-    Parser.Rule('simpleItems', ['simpleItem']),
-    Parser.Rule('simpleItems', ['simpleItem', 'simpleItems']),
-    Parser.Rule('simpleItem', ['identifier']),
-    Parser.Rule('simpleItem', ['dqString']),
-    Parser.Rule('simpleItem', ['sqString'])
-], expand=['rules', 'rhsItems', 'alternates', 'decorator', 'simpleItem', 'simpleItems'], ignore=['::=', '|', '$', '(', ')'])
-
 NATIVE_ESCAPE = { "a": "\a", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v", }
 def escape(string):
     ret, inEscape = "", False
@@ -86,7 +17,14 @@ def escape(string):
             inEscape = True
     return ret
 
-def makeLexer(config):
+def charsetKey(charset):
+    return None if charset is None else "".join(sorted(charset))
+
+def makeLexer(config, cache=None, charset=Lexer.DEFAULT_CHARSET, backend="auto"):
+    key = ("lexer", config, charsetKey(charset), backend)
+    return Cache.cached(key, lambda: _makeLexer(config, charset, backend), Lexer.Lexer.fromTables, cache)
+
+def _makeLexer(config, charset=Lexer.DEFAULT_CHARSET, backend="auto"):
 
     tokens = _lexerLexer.parse(config)
     lexerRules = _lexerParser.parse(tokens)
@@ -115,14 +53,21 @@ def makeLexer(config):
                 value = rule.child[1].value[1:-1]
             isRegex = rule.child[1].name == 'reString'
             regexs.append(Lexer.Rule(name, value, isRegex=isRegex))
-    return Lexer.Lexer(regexs + keys, ignore=ignore)
+    return Lexer.Lexer(regexs + keys, ignore=ignore, charset=charset, backend=backend)
 
-def makeParser(config, start=None):
-    tokens = _parserLexer.parse(config)
-    tree = _parserParser.parse(tokens)
-    return _makeParser(tree, start)
+PARSER_LADDERS = {
+    "auto": [Parser.LALRParser, Parser.LR1Parser, Parser.GLRParser, Parser.EarleyParser],
+    "lalr": [Parser.LALRParser],
+    "lr1": [Parser.LR1Parser],
+    "glr": [Parser.GLRParser],
+    "earley": [Parser.EarleyParser],
+}
 
-def _makeParser(tree, start=None):
+def makeParser(config, start=None, cache=None, algorithm="auto"):
+    key = ("parser", config, start, algorithm)
+    return Cache.cached(key, lambda: _makeParser(_parserParser.parse(_parserLexer.parse(config)), start, algorithm), Parser.Parser.fromTables, cache)
+
+def _makeParser(tree, start=None, algorithm="auto"):
 
     expand = []
     rules = []
@@ -185,45 +130,83 @@ def _makeParser(tree, start=None):
             getRules(rule.child[1:], lhs)
     extraConfig.setdefault('expand', []).extend(expand)
 
-    try:
-        return Parser.LR1Parser(start, rules, **extraConfig)
-    except:
-        print("Can't build LR1 parser, fallback")
-    return Parser.EarleyParser(start, rules, **extraConfig)
+    ladder = PARSER_LADDERS[algorithm]
+    for parser in ladder[:-1]:
+        try:
+            return parser(start, rules, **extraConfig)
+        except RuntimeError as err:
+            if str(err) != parser.CONFLICT:
+                raise
+    return ladder[-1](start, rules, **extraConfig)
 
 class DSL:
 
-    def __init__(self, lexer, parser):
+    def __init__(self, lexer, parser, actions=None):
         self.lexer = lexer
         self.parser = parser
+        self.actions = actions
 
     def parse(self, config):
-        return self.parser.parse(self.lexer.parse(config))
-
-_dslLexer = makeLexer(r"""#dsl
-    %keys ::= '$' '|' '::=' '(' ')' '*' '+' '?'
-    identifier ::= /[_a-zA-Z][_a-zA-Z0-9]*/
-    sqString ::= /'[^']*'/
-    dqString ::= /"[^"\\]*(\\\\.[^"\\]*)*"/
-    reString ::= /\/[^\/\\]*(\\\\.[^\/\\]*)*\//
-    configType ::= /%(ignore|expandSingle|expand)/
-    comment ::= /#[^\n]*\n/
-    %ignore ::= comment
-""")
-_dslParser = makeParser(r"""#dsl
-    DSLRules ::= rule*
-    rule ::= identifier '::=' reString # define RE
-           | identifier '::=' alternate ('|' alternate)*
-           | configType '::=' simpleItem+
-    alternate ::= '$' | rhsItem+
-    rhsItem ::= itemValue ('?' | '+' | '*')?
-    itemValue ::= simpleItem | '(' alternate ('|' alternate)* ')'
-    simpleItem ::= identifier | dqString | sqString
-    %ignore ::= '::=' '|' '$' '(' ')'
-    %expand ::= simpleItem
-""")
-
-def makeDSL(config):
+        return self.parser.parse(self.lexer.tokens(self.lexer.scanString(config)), self.actions)
+
+    def parseIncremental(self, config):
+        return self.parser.parseIncremental(self.lexer.parseTokenArray(config), self.actions)
+
+    def edit(self, state, offset, deleted, inserted):
+        tokens = state.tokens
+        if state.tree is not None:
+            try:
+                change = self.lexer.relex(tokens, offset, deleted, inserted)
+            except RuntimeError:
+                state.tree = None
+                state.tokens = Lexer.TokenArray(tokens.names, tokens.source[:offset] + inserted + tokens.source[offset + deleted:], tokens.encoding)
+                raise
+            return self.parser.reparse(state, *change)
+        source = tokens.source[:offset] + inserted + tokens.source[offset + deleted:]
+        try:
+            state.tokens = self.lexer.parseTokenArray(source, tokens.encoding)
+        except RuntimeError:
+            state.tokens = Lexer.TokenArray(tokens.names, source, tokens.encoding)
+            raise
+        return self.parser.reparse(state, 0, 0, len(state.tokens))
+
+    def parseMany(self, configs, workers=None, chunkSize=1, ordered=True):
+        if workers == 1:
+            parsed = map(self.parse, configs)
+            yield from parsed if ordered else enumerate(parsed)
+            return
+        import multiprocessing
+        with multiprocessing.Pool(workers or os.cpu_count(), _initWorker, (self,)) as pool:
+            if ordered:
+                yield from pool.imap(_parseWorker, configs, chunkSize)
+            else:
+                yield from pool.imap_unordered(_parseIndexed, enumerate(configs), chunkSize)
+
+    def toTables(self):
+        return (self.lexer.toTables(), self.parser.toTables())
+
+    @classmethod
+    def fromTables(cls, tables):
+        return DSL(Lexer.Lexer.fromTables(tables[0]), Parser.Parser.fromTables(tables[1]))
+
+_workerDSL = None
+def _initWorker(dsl):
+    global _workerDSL
+    _workerDSL = dsl
+
+def _parseWorker(config):
+    return _workerDSL.parse(config)
+
+def _parseIndexed(item):
+    return item[0], _workerDSL.parse(item[1])
+
+def makeDSL(config, cache=None, charset=Lexer.DEFAULT_CHARSET, backend="auto", algorithm="auto", actions=None):
+    key = ("dsl", config, charsetKey(charset), backend, algorithm)
+    dsl = Cache.cached(key, lambda: _makeDSL(config, charset, backend, algorithm), DSL.fromTables, cache)
+    dsl.actions = actions
+    return dsl
+
+def _makeDSL(config, charset=Lexer.DEFAULT_CHARSET, backend="auto", algorithm="auto"):
 
     tokens = _dslLexer.parse(config)
     tree = _dslParser.parse(tokens)
@@ -250,6 +233,121 @@ def makeDSL(config):
             nchild.append(rule)
     tree.child = nchild
 
-    lexer = Lexer.Lexer(regexs + list(keys))
-    parser = _makeParser(tree)
+    lexer = Lexer.Lexer(regexs + list(keys), charset=charset, backend=backend)
+    parser = _makeParser(tree, algorithm=algorithm)
     return DSL(lexer, parser)
+
+BOOTSTRAP = ["_lexerLexer", "_lexerParser", "_parserLexer", "_parserParser", "_dslLexer", "_dslParser"]
+
+def _buildBootstrap():
+
+    global _lexerLexer, _lexerParser, _parserLexer, _parserParser, _dslLexer, _dslParser
+
+    _lexerLexer = Lexer.Lexer([
+        Lexer.Rule("::=", "::=", isRegex=False),
+        Lexer.Rule("%keys", "%keys", isRegex=False),
+        Lexer.Rule("%ignore", "%ignore", isRegex=False),
+        Lexer.Rule("comment", "#[^\n]*\n"),
+        Lexer.Rule("identifier", "[_a-zA-Z][_a-zA-Z0-9]*"),
+        Lexer.Rule("sqString", "'[^']*'"),
+        Lexer.Rule("dqString", "\"[^\"\\]*(\\\\.[^\"\\]*)*\""),
+        Lexer.Rule("reString", "/[^/\\]*(\\\\.[^/\\]*)*/"),
+    ], ignore=["comment"], charset=None)
+    _lexerParser = Parser.EarleyParser("LexRules", [
+        Parser.Rule("LexRules", ["rules"]),
+        Parser.Rule("rules", []),
+        Parser.Rule("rules", ["rule", "rules"]),
+        Parser.Rule("rule", ["identifier", "::=", "sqString"]),
+        Parser.Rule("rule", ["identifier", "::=", "dqString"]),
+        Parser.Rule("rule", ["identifier", "::=", "reString"]),
+        Parser.Rule("rule", ["%keys", "::=", "keys"]),
+        Parser.Rule("rule", ["%ignore", "::=", "elements"]),
+        Parser.Rule("keys", ["key"]),
+        Parser.Rule("keys", ["key", "keys"]),
+        Parser.Rule("key", ["sqString"]),
+        Parser.Rule("key", ["dqString"]),
+        Parser.Rule("elements", ["element"]),
+        Parser.Rule("elements", ["element", "elements"]),
+        Parser.Rule("element", ["identifier"]),
+        Parser.Rule("element", ["sqString"]),
+        Parser.Rule("element", ["dqString"]),
+    ], expand=["rules", "keys", "key", "element", "elements"], ignore=["::="])
+
+    _parserLexer = Lexer.Lexer([
+        Lexer.Rule("$", "$", isRegex=False),
+        Lexer.Rule("|", "|", isRegex=False),
+        Lexer.Rule("(", "(", isRegex=False),
+        Lexer.Rule(")", ")", isRegex=False),
+        Lexer.Rule("$", "$", isRegex=False),
+        Lexer.Rule("+", "+", isRegex=False),
+        Lexer.Rule("*", "*", isRegex=False),
+        Lexer.Rule("?", "?", isRegex=False),
+        Lexer.Rule("::=", "::=", isRegex=False),
+        Lexer.Rule("configType", "%(ignore|expandSingle|expand)"),
+        Lexer.Rule("identifier", "[_a-zA-Z][_a-zA-Z0-9]*"),
+        Lexer.Rule("sqString", "'[^']*'"),
+        Lexer.Rule("dqString", "\"[^\"\\]*(\\.[^\"\\]*)*\""),
+        Lexer.Rule("comment", "#[^\n]*\n"),
+    ], ignore=["comment"], charset=None)
+    _parserParser = Parser.EarleyParser('ParseRules', [
+        Parser.Rule('ParseRules', ['rules']),
+        Parser.Rule('rules', []),
+        Parser.Rule('rules', ['rule', 'rules']),
+        Parser.Rule('rule', ['identifier', '::=', 'alternates']),
+        Parser.Rule('rule', ['configType', '::=', 'simpleItems']),
+        Parser.Rule('alternates', ['alternate']),
+        Parser.Rule('alternates', ['alternate', '|', 'alternates']),
+        Parser.Rule('alternate', ['$']),
+        Parser.Rule('alternate', ['rhsItems']),
+        Parser.Rule('rhsItems', ['rhsItem']),
+        Parser.Rule('rhsItems', ['rhsItem', 'rhsItems']),
+        Parser.Rule('rhsItem', ['itemValue', 'decorator']),
+        Parser.Rule('itemValue', ['simpleItem']),
+        Parser.Rule('itemValue', ['(', 'alternates', ')']),
+        Parser.Rule('decorator', []),
+        Parser.Rule('decorator', ['?']),
+        Parser.Rule('decorator', ['+']),
+        Parser.Rule('decorator', ['*']),
+        Parser.Rule('simpleItems', ['simpleItem']),
+        Parser.Rule('simpleItems', ['simpleItem', 'simpleItems']),
+        Parser.Rule('simpleItem', ['identifier']),
+        Parser.Rule('simpleItem', ['dqString']),
+        Parser.Rule('simpleItem', ['sqString'])
+    ], expand=['rules', 'rhsItems', 'alternates', 'decorator', 'simpleItem', 'simpleItems'], ignore=['::=', '|', '$', '(', ')'])
+    _dslLexer = _makeLexer(r"""#dsl
+        %keys ::= '$' '|' '::=' '(' ')' '*' '+' '?'
+        identifier ::= /[_a-zA-Z][_a-zA-Z0-9]*/
+        sqString ::= /'[^']*'/
+        dqString ::= /"[^"\\]*(\\\\.[^"\\]*)*"/
+        reString ::= /\/[^\/\\]*(\\\\.[^\/\\]*)*\//
+        configType ::= /%(ignore|expandSingle|expand)/
+        comment ::= /#[^\n]*\n/
+        %ignore ::= comment
+    """, charset=None)
+    _dslParser = makeParser(r"""#dsl
+        DSLRules ::= rule*
+        rule ::= identifier '::=' reString # define RE
+               | identifier '::=' alternate ('|' alternate)*
+               | configType '::=' simpleItem+
+        alternate ::= '$' | rhsItem+
+        rhsItem ::= itemValue ('?' | '+' | '*')?
+        itemValue ::= simpleItem | '(' alternate ('|' alternate)* ')'
+        simpleItem ::= identifier | dqString | sqString
+        %ignore ::= '::=' '|' '$' '(' ')'
+        %expand ::= simpleItem
+    """, cache=False)
+
+def _loadBootstrap():
+    try:
+        import _dslTables
+    except ImportError:
+        return False
+    if _dslTables.VERSION != Cache.version():
+        return False
+    for name in BOOTSTRAP:
+        tables = _dslTables.TABLES[name]
+        globals()[name] = Lexer.Lexer.fromTables(tables) if name.endswith("Lexer") else Parser.Parser.fromTables(tables)
+    return True
+
+if not _loadBootstrap():
+    _buildBootstrap()
@@ -1,13 +1,27 @@
 #!/usr/bin/python3
 
+import array
+import bisect
+import hashlib
+import itertools
+import linecache
+import re
+
 import Parser
 import Regex
 
+SPACES = "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+BYTE_SPACES = b" \t\n\r\x0b\x0c"
+
 class Token:
 
-    def __init__(self, name, value):
+    __slots__ = ("name", "value", "line", "column")
+
+    def __init__(self, name, value, line=None, column=None):
         self.name = name
         self.value = value
+        self.line = line
+        self.column = column
 
     def __str__(self):
         return "(" + self.name + ":" + self.value + ")"
@@ -15,6 +29,122 @@ class Token:
     def __repr__(self):
         return str(self)
 
+    def __reduce__(self):
+        return (Token, (self.name, self.value, self.line, self.column))
+
+class BufferToken(Token):
+
+    __slots__ = ("buffer", "start", "end", "encoding")
+
+    def __init__(self, name, buffer, start, end, encoding="utf-8", line=None, column=None):
+        self.name = name
+        self.buffer = buffer
+        self.start = start
+        self.end = end
+        self.encoding = encoding
+        self.line = line
+        self.column = column
+
+    @property
+    def value(self):
+        return bytes(self.buffer[self.start:self.end]).decode(self.encoding)
+
+class ArrayToken(Token):
+
+    __slots__ = ("array", "anchor")
+
+    def __init__(self, name, value, array, start):
+        self.name = name
+        self.value = value
+        self.array = array
+        self.anchor = (start, len(array.edits))
+
+    def offset(self):
+        start, epoch = self.anchor
+        edits = self.array.edits
+        for offset, deleted, delta in itertools.islice(edits, epoch, None):
+            if start >= offset + deleted:
+                start += delta
+        self.anchor = (start, len(edits))
+        return start
+
+    @property
+    def line(self):
+        return self.array.locate(self.offset())[0]
+
+    @property
+    def column(self):
+        return self.array.locate(self.offset())[1]
+
+class OffsetArray:
+
+    def __init__(self, values=()):
+        self.values = array.array("q", values)
+        self.split = 0
+        self.delta = 0
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, idx):
+        return self.values[idx] + self.delta if idx >= self.split else self.values[idx]
+
+    def append(self, value):
+        self.values.append(value - self.delta if len(self.values) >= self.split else value)
+
+    def moveSplit(self, idx):
+        if self.delta and idx > self.split:
+            self.values[self.split:idx] = array.array("q", map(self.delta.__add__, self.values[self.split:idx]))
+        elif self.delta and idx < self.split:
+            self.values[idx:self.split] = array.array("q", map((-self.delta).__add__, self.values[idx:self.split]))
+        self.split = idx
+
+    def replace(self, first, last, values, delta):
+        self.moveSplit(last)
+        self.values[first:last] = array.array("q", values)
+        self.split += len(values) - (last - first)
+        self.delta += delta
+
+class TokenArray:
+
+    def __init__(self, names, source, encoding="utf-8"):
+        self.names = names
+        self.source = source
+        self.encoding = encoding
+        self.ids = array.array("i")
+        self.starts = OffsetArray()
+        self.ends = OffsetArray()
+        self.lineStarts = None
+        self.edits = []
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, idx):
+        return ArrayToken(self.name(idx), self.value(idx), self, self.starts[idx])
+
+    def __iter__(self):
+        return map(self.__getitem__, range(len(self.ids)))
+
+    def name(self, idx):
+        return self.names[self.ids[idx]]
+
+    def value(self, idx):
+        value = self.source[self.starts[idx]:self.ends[idx]]
+        return value if isinstance(value, str) else bytes(value).decode(self.encoding)
+
+    def location(self, idx):
+        return self.locate(self.starts[idx])
+
+    def locate(self, offset):
+        if self.lineStarts is None:
+            newline = "\n" if isinstance(self.source, str) else b"\n"
+            lineStarts = OffsetArray([0])
+            lineStarts.values.extend(match.end() for match in re.finditer(newline, self.source))
+            self.lineStarts = lineStarts
+        line = bisect.bisect_right(self.lineStarts, offset)
+        return line, offset - self.lineStarts[line-1] + 1
+
 class Rule:
 
     def __init__(self, name, value, isRegex=True):
@@ -28,50 +158,381 @@ class Rule:
     def __repr__(self):
         return str(self)
 
+def countLines(window, newline, start, end, base, line, lineStart):
+    found = window.rfind(newline, start, end)
+    if found < 0:
+        return line, lineStart
+    return line + window.count(newline, start, end), base + found + 1
+
+DEFAULT_CHARSET = frozenset(map(chr, range(128)))
+
 class Lexer:
 
-    def __init__(self, rules, strict=False, ignore=[], charset=frozenset(map(chr, range(128)))):
+    BACKENDS = ("auto", "dfa", "re", "code")
+
+    def __init__(self, rules, strict=False, ignore=[], charset=DEFAULT_CHARSET, backend="auto"):
         self.rules = rules
         self.strict = strict
         self.ignore = ignore
         self.charset = charset
+        self.backend = backend
+        self.source = None
 
-        self.ldfa = None
+        nfas = []
         for rule in self.rules:
             value = rule.value if rule.isRegex else "\\" + "\\".join(rule.value)
-            ldfa = Regex.regexToLDFA(value, self.charset)
-            if self.ldfa is None:
-                self.ldfa = ldfa
-            else:
-                self.ldfa.merge(ldfa)
+            nfas.append(Regex.SimpleNFA.fromRegex(value))
+        self.alphabet = Regex.Alphabet(self.charset, nfas)
+
+        self.ldfa = Regex.LDFA.fromNFAs(nfas, self.alphabet)
         self.ldfa.minimize()
+        self.prepare()
+
+    def prepare(self):
+        table = self.ldfa.table
+        sink = -1 if self.ldfa.sink is None else self.ldfa.sink * len(self.alphabet)
+        startsToken = lambda ch: table[self.alphabet.classOf(ch)] != sink
+        self.spaceRun = None if any(map(startsToken, SPACES)) else re.compile(r"\s+")
+        self.byteSpaceRun = None if any(map(startsToken, map(chr, BYTE_SPACES))) else re.compile(rb"\s+")
+        self.lookahead = self.buildLookahead()
+
+        if self.backend not in self.BACKENDS:
+            raise RuntimeError("Unknown lexer backend: " + str(self.backend))
+        self.patternBuilt = False
+        if self.backend == "re" and self.pattern is None:
+            raise RuntimeError("Can't translate lexer rules to re")
+
+        self.match = None
+        if self.backend == "code":
+            if self.source is None:
+                self.source = self.toSource()
+            filename = "<lexer {0}>".format(hashlib.sha256(self.source.encode("utf-8")).hexdigest()[:16])
+            linecache.cache[filename] = (len(self.source), None, self.source.splitlines(True), filename)
+            namespace = {}
+            exec(compile(self.source, filename, "exec"), namespace)
+            self.match = namespace["match"]
+
+    @property
+    def pattern(self):
+        if not self.patternBuilt:
+            self.compiledPattern = None if self.backend in ("dfa", "code") else self.buildPattern()
+            self.patternBuilt = True
+        return self.compiledPattern
+
+    def buildLookahead(self):
+        edges, labels, sink = self.ldfa.edges, self.ldfa.labels, self.ldfa.sink
+        pending = lambda state: state != sink and not labels[state]
+        roots = [_next for state in range(len(edges)) if state != sink and labels[state] for _next in edges[state] if pending(_next)]
+        depth = {}
+        for root in roots:
+            if root in depth:
+                continue
+            depth[root] = None
+            stack = [(root, iter(edges[root]))]
+            while len(stack) > 0:
+                state, nexts = stack[-1]
+                for _next in nexts:
+                    if pending(_next) and _next not in depth:
+                        depth[_next] = None
+                        stack.append((_next, iter(edges[_next])))
+                        break
+                    if pending(_next) and depth[_next] is None:
+                        return None
+                else:
+                    stack.pop()
+                    depth[state] = 1 + max([depth[_next] for _next in edges[state] if pending(_next)] or [0])
+        return 1 + max([depth[root] for root in roots] or [0])
+
+    def toSource(self):
+        header = "# Generated by PyDSL, match(text, idx, length) returns (rule index + 1, end) of the longest token at idx, or (0, idx).\n"
+        rules = "RULES = {0!r}\n\n".format([(rule.name, rule.value, rule.isRegex) for rule in self.rules])
+        return header + rules + self.ldfa.toSource()
+
+    def dump(self, path):
+        with open(path, "w") as output:
+            output.write(self.source if self.source is not None else self.toSource())
+
+    def buildPattern(self):
+        universe = Regex.universeOf(self.charset)
+        groups, labels, keywords = [], [None], [None]
+        if self.spaceRun is not None and not self.strict:
+            groups.append("(?P<space>\\s+)")
+            labels.append(0)
+            keywords.append(None)
+
+        regexs, literals = [], {}
+        for label, rule in enumerate(self.rules, 1):
+            if rule.isRegex:
+                translated = Regex.toPattern(Regex.parseRegex(rule.value), universe)
+                if translated is None:
+                    return None
+                regexs.append((label, translated[0], translated[1]))
+            elif len(rule.value) > 0 and all(Regex.inRanges(universe, ord(ch)) for ch in rule.value):
+                literals[rule.value] = label
+
+        firsts = sorted(bound for label, pattern, first in regexs for bound in first)
+        if any(firsts[idx][0] <= firsts[idx-1][1] for idx in range(1, len(firsts))):
+            return None
+
+        owned = [{} for regex in regexs]
+        keys = {}
+        for literal, label in literals.items():
+            owner = [idx for idx, regex in enumerate(regexs) if Regex.inRanges(regex[2], ord(literal[0]))]
+            if len(owner) == 0:
+                keys[literal] = label
+            elif re.fullmatch(regexs[owner[0]][1], literal) is None:
+                return None
+            elif label > regexs[owner[0]][0]:
+                owned[owner[0]][literal] = label
+
+        for (label, pattern, first), owns in zip(regexs, owned):
+            groups.append("(?P<r{0}>{1})".format(label, pattern))
+            labels.append(label)
+            keywords.append(owns if len(owns) > 0 else None)
+        if len(keys) > 0:
+            groups.append("(?P<keys>" + "|".join(map(re.escape, sorted(keys, key=lambda key: (-len(key), key)))) + ")")
+            labels.append(0)
+            keywords.append(keys)
+
+        if len(labels) == 1:
+            return None
+        self.patternLabels = labels
+        self.patternKeywords = keywords
+        return re.compile("|".join(groups))
+
+    def toTables(self):
+        rules = tuple((rule.name, rule.value, rule.isRegex) for rule in self.rules)
+        charset = None if self.charset is None else "".join(sorted(self.charset))
+        return (rules, self.strict, tuple(self.ignore), charset, self.alphabet.toTables(), self.ldfa.toTables(), self.backend, self.source)
+
+    @classmethod
+    def fromTables(cls, tables):
+        rules, strict, ignore, charset, alphabetTables, ldfaTables, backend, source = tables
+        lexer = cls.__new__(cls)
+        lexer.rules = [Rule(name, value, isRegex) for name, value, isRegex in rules]
+        lexer.strict = strict
+        lexer.ignore = list(ignore)
+        lexer.charset = None if charset is None else frozenset(charset)
+        lexer.backend = backend
+        lexer.source = source
+        lexer.alphabet = Regex.Alphabet.fromTables(alphabetTables)
+        lexer.ldfa = Regex.LDFA.fromTables(ldfaTables, lexer.alphabet)
+        lexer.prepare()
+        return lexer
+
+    def __reduce__(self):
+        return (self.fromTables, (self.toTables(),))
 
     def parse(self, string):
+        return list(self.tokens(self.scanString(string)))
 
-        idx = 0
-        tokens = []
-        while idx < len(string):
+    def iterparse(self, source, chunkSize=1 << 16):
+        if hasattr(source, "read"):
+            read = source.read
+            source = iter(lambda: read(chunkSize), "")
+        return self.tokenize(source)
 
-            nidx = idx
-            cut = None
-            self.ldfa.init()
+    def tokenize(self, chunks):
+        return self.tokens(self.scan(chunks))
 
-            while nidx < len(string) and not self.ldfa.sinked():
-                self.ldfa.shift(string[nidx])
-                if self.ldfa.label() > 0:
-                    cut = (nidx+1, self.ldfa.label()-1)
-                nidx += 1
+    def tokens(self, spans):
+        names = [None] + [rule.name for rule in self.rules]
+        for label, window, idx, cut, base, line, column in spans:
+            yield Token(names[label], window[idx:cut], line, column)
+
+    def parseBuffer(self, buffer, encoding="utf-8"):
+        return list(self.tokenizeBuffer(buffer, encoding))
+
+    def tokenizeBuffer(self, buffer, encoding="utf-8", blockSize=1 << 16):
+        names = [None] + [rule.name for rule in self.rules]
+        for label, window, idx, cut, base, line, column in self.scan(self.blocks(buffer, blockSize), True):
+            yield BufferToken(names[label], buffer, base + idx, base + cut, encoding, line, column)
+
+    def parseTokenArray(self, source, encoding="utf-8"):
+        binary = not isinstance(source, str)
+        tokens = TokenArray([rule.name for rule in self.rules], source, encoding)
+        ids, starts, ends = tokens.ids, tokens.starts.values, tokens.ends.values
+        for label, window, idx, cut, base, line, column in self.scan(self.blocks(source), True) if binary else self.scanString(source):
+            ids.append(label - 1)
+            starts.append(base + idx)
+            ends.append(base + cut)
+        return tokens
+
+    def relex(self, tokens, offset, deleted, inserted):
+        source = tokens.source
+        source = source[:offset] + inserted + source[offset + deleted:]
+        ids, starts, ends = tokens.ids, tokens.starts, tokens.ends
+        delta = len(inserted) - deleted
+        first = 0 if self.lookahead is None else bisect.bisect_right(ends, offset - self.lookahead)
+        restart = ends[first - 1] if first > 0 else 0
+        old = bisect.bisect_left(starts, offset + deleted)
+        if isinstance(source, str):
+            spans = self.scanString(source, restart)
+        else:
+            spans = ((label, window, idx, cut, base + restart, line, column) for label, window, idx, cut, base, line, column in self.scan(self.blocks(memoryview(source)[restart:]), True))
+
+        nids, nstarts, nends = array.array("i"), array.array("q"), array.array("q")
+        for label, window, idx, cut, base, line, column in spans:
+            start = base + idx
+            if start >= offset + len(inserted):
+                while old < len(starts) and starts[old] + delta < start:
+                    old += 1
+                if old < len(starts) and starts[old] + delta == start:
+                    break
+            nids.append(label - 1)
+            nstarts.append(start)
+            nends.append(base + cut)
+        else:
+            old = len(starts)
+
+        ids[first:old] = nids
+        starts.replace(first, old, nstarts, delta)
+        ends.replace(first, old, nends, delta)
+        if tokens.lineStarts is not None:
+            lineStarts = tokens.lineStarts
+            keep = bisect.bisect_right(lineStarts, offset)
+            tail = bisect.bisect_right(lineStarts, offset + deleted)
+            newline = "\n" if isinstance(source, str) else b"\n"
+            lineStarts.replace(keep, tail, [offset + match.end() for match in re.finditer(newline, inserted)], delta)
+        tokens.source = source
+        tokens.edits.append((offset, deleted, delta))
+        return first, old - first, len(nids)
+
+    @classmethod
+    def blocks(cls, buffer, blockSize=1 << 16):
+        view = memoryview(buffer).cast("B")
+        for start in range(0, len(view), blockSize):
+            yield view[start:start+blockSize].tobytes()
 
-            if cut:
-                if self.rules[cut[1]].name not in self.ignore:
-                    tokens.append(Token(self.rules[cut[1]].name, string[idx:cut[0]]))
-                idx = cut[0]
+    def scanString(self, string, start=0):
+        if self.pattern is not None:
+            return self.scanPattern(string, start)
+        if self.match is not None:
+            return self.scanCode(string, start)
+        if start == 0:
+            return self.scan([string])
+        lines, offset = string.count("\n", 0, start), start - string.rfind("\n", 0, start) - 1
+        return ((label, window, idx, cut, base + start, line + lines, column + offset if line == 1 else column)
+            for label, window, idx, cut, base, line, column in self.scan(self.slices(string, start)))
+
+    @classmethod
+    def slices(cls, string, start, blockSize=1 << 16):
+        for idx in range(start, len(string), blockSize):
+            yield string[idx:idx+blockSize]
+
+    def scanCode(self, string, start=0):
+
+        match, spaceRun = self.match, self.spaceRun
+        ignored = [True] + [rule.name in self.ignore for rule in self.rules]
+        find, length = string.find, len(string)
+
+        line, lineStart, nextLine = string.count("\n", 0, start) + 1, string.rfind("\n", 0, start) + 1, find("\n", start)
+        idx = start
+        while idx < length:
+            label, cut = match(string, idx, length)
+            if label:
+                if not ignored[label]:
+                    while 0 <= nextLine < idx:
+                        line, lineStart, nextLine = line + 1, nextLine + 1, find("\n", nextLine + 1)
+                    yield label, string, idx, cut, 0, line, idx - lineStart + 1
+                idx = cut
+            elif not self.strict and string[idx].isspace():
+                idx = idx + 1 if spaceRun is None else spaceRun.match(string, idx).end()
+            else:
+                line, lineStart = countLines(string, "\n", lineStart, idx, 0, line, lineStart)
+                raise RuntimeError("Can't parse string at line {0}, column {1}".format(line, idx - lineStart + 1))
+
+    def scanPattern(self, string, start=0):
+
+        labels, keywords = self.patternLabels, self.patternKeywords
+        ignored = [True] + [rule.name in self.ignore for rule in self.rules]
+        find, length = string.find, len(string)
+
+        line, lineStart, nextLine = string.count("\n", 0, start) + 1, string.rfind("\n", 0, start) + 1, find("\n", start)
+        idx = start
+        while True:
+            for match in iter(self.pattern.scanner(string, idx).match, None):
+                group = match.lastindex
+                start, idx = match.span()
+                label = labels[group]
+                if keywords[group] is not None:
+                    label = keywords[group].get(string[start:idx], label)
+                if not ignored[label]:
+                    while 0 <= nextLine < start:
+                        line, lineStart, nextLine = line + 1, nextLine + 1, find("\n", nextLine + 1)
+                    yield label, string, start, idx, 0, line, start - lineStart + 1
+
+            if idx == length:
+                return
             elif not self.strict and string[idx].isspace():
                 idx += 1
             else:
-                print(string[idx:])
-                raise RuntimeError("Can't parse string")
-        return tokens
+                line, lineStart = countLines(string, "\n", lineStart, idx, 0, line, lineStart)
+                raise RuntimeError("Can't parse string at line {0}, column {1}".format(line, idx - lineStart + 1))
+
+    def scan(self, chunks, binary=False):
+
+        table = self.ldfa.table
+        labels = self.ldfa.labelTable
+        sink = -1 if self.ldfa.sink is None else self.ldfa.sink * len(self.alphabet)
+        ignored = [True] + [rule.name in self.ignore for rule in self.rules]
+        if binary:
+            translate, spaceRun, newline = self.alphabet.translateBytes, self.byteSpaceRun, b"\n"
+            isSpace = lambda window, idx: window[idx] in BYTE_SPACES
+        else:
+            translate, spaceRun, newline = self.alphabet.translate, self.spaceRun, "\n"
+            isSpace = lambda window, idx: window[idx].isspace()
+
+        skipSpace = None if self.strict or spaceRun is None else re.compile(rb"\s*" if binary else r"\s*").match
+        chunks = iter(chunks)
+        window = newline[:0]
+        classes = translate(window)
+        eof = False
+        base = 0
+
+        line = 1
+        lineStart = counted = 0
+
+        idx = nidx = cut = label = state = 0
+        while True:
+
+            length = len(window)
+            while nidx < length:
+                state = table[state + classes[nidx]]
+                if state == sink:
+                    break
+                nidx += 1
+                if labels[state]:
+                    cut = nidx
+                    label = labels[state]
+            else:
+                if not eof:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        eof = True
+                    else:
+                        line, lineStart = countLines(window, newline, counted, idx, base, line, lineStart)
+                        window, classes = window[idx:] + chunk, classes[idx:] + translate(chunk)
+                        nidx, cut, counted, idx, base = nidx - idx, cut - idx, 0, 0, base + idx
+                    continue
+                elif idx == length:
+                    return
+
+            if label:
+                if not ignored[label]:
+                    found = window.rfind(newline, counted, idx)
+                    if found >= 0:
+                        line, lineStart = line + window.count(newline, counted, idx), base + found + 1
+                    counted = idx
+                    yield label, window, idx, cut, base, line, base + idx - lineStart + 1
+                idx = cut if skipSpace is None else skipSpace(window, cut).end()
+            elif not self.strict and isSpace(window, idx):
+                idx = idx + 1 if spaceRun is None else min(spaceRun.match(window, idx).end(), length)
+            else:
+                line, lineStart = countLines(window, newline, counted, idx, base, line, lineStart)
+                raise RuntimeError("Can't parse string at line {0}, column {1}".format(line, base + idx - lineStart + 1))
+            nidx = cut = idx
+            label = state = 0
 
 if __name__ == "__main__":
     Lexer([
@@ -1,3 +1,6 @@
+import array
+import itertools
+import threading
 
 class Rule:
 
@@ -23,8 +26,8 @@ class Node:
         self.name = name
         self.child = child
 
-    def extended(self, nch):
-        return Node(self.name, self.child + [nch])
+    def __reduce__(self):
+        return (Node, (self.name, self.child))
 
     def __str__(self, depth=0):
         result = '  ' * depth + self.name + "\n"
@@ -39,6 +42,36 @@ class Node:
     def __repr__(self):
         return str(self)
 
+class Expansion:
+
+    __slots__ = ("parts", "size")
+
+    def __init__(self, parts):
+        self.parts = parts
+        self.size = sum(part.size if type(part) is Expansion else 1 for part in parts)
+
+    def values(self):
+        result, stack = [], [self]
+        while len(stack) > 0:
+            part = stack.pop()
+            if type(part) is Expansion:
+                stack.extend(reversed(part.parts))
+            else:
+                result.append(part)
+        return result
+
+class ParseState:
+
+    def __init__(self, tokens, actions=None):
+        self.tokens = tokens
+        self.actions = actions
+        self.tree = None
+
+REDUCE_NODE = 0
+REDUCE_EXPAND = 1
+REDUCE_SINGLE = 2
+REDUCE_IGNORE = 3
+
 class Parser:
 
     INIT_SYM = "$"
@@ -68,249 +101,948 @@ class Parser:
             repr(self.expand),
             repr(self.expandSingle))
 
-    def flatten(self, node):
-        if node.name in self.ignore:
-            return []
-
-        nchild = []
-        for ch in node.child:
-            if isinstance(ch, Node):
-                nchild.extend(self.flatten(ch))
-            elif ch.name not in self.ignore:
-                nchild.append(ch)
-        if node.name in self.expand or (node.name in self.expandSingle and len(nchild) == 1):
-            return nchild
-        else:
-            node.child = nchild
-            return [node]
+    def toTables(self):
+        rules = tuple((rule.lhs, tuple(rule.rhs)) for rule in self.orgiRules)
+        config = (tuple(self.ignore), tuple(self.expand), tuple(self.expandSingle))
+        return (self.__class__.__name__, self.start, rules, config)
+
+    @classmethod
+    def fromTables(cls, tables):
+        kind, start, rules, config = tables[:4]
+        rules = [Rule(lhs, list(rhs)) for lhs, rhs in rules]
+        ignore, expand, expandSingle = map(list, config)
+        parser = PARSERS[kind].__new__(PARSERS[kind])
+        Parser.__init__(parser, start, rules, ignore, expand, expandSingle)
+        parser.loadTables(tables[4:])
+        return parser
+
+    def __reduce__(self):
+        return (Parser.fromTables, (self.toTables(),))
+
+    def loadTables(self, tables):
+        pass
+
+    def encode(self):
+        self.ruleList = [self.initRule] + self.orgiRules
+        self.terminals = [None]
+        self.terminalIndex = {None: 0}
+        self.itemRule = []
+        self.itemNext = []
+        self.ruleStart = []
+        self.ruleItems = {}
+        for idx, rule in enumerate(self.ruleList):
+            self.ruleStart.append(len(self.itemRule))
+            self.ruleItems.setdefault(rule.lhs, []).append(len(self.itemRule))
+            for pos in range(len(rule.rhs) + 1):
+                self.itemRule.append(idx)
+                self.itemNext.append(rule.rhs[pos] if pos < len(rule.rhs) else None)
+                if pos < len(rule.rhs) and rule.rhs[pos] not in self.rules and rule.rhs[pos] not in self.terminalIndex:
+                    self.terminalIndex[rule.rhs[pos]] = len(self.terminals)
+                    self.terminals.append(rule.rhs[pos])
+
+    def buildNullable(self):
+        self.nullable = {}
+        update = True
+        while update:
+            update = False
+            for idx, rule in enumerate(self.ruleList):
+                if rule.lhs not in self.nullable and all(sym in self.nullable for sym in rule.rhs):
+                    self.nullable[rule.lhs] = self.ruleStart[idx] + len(rule.rhs)
+                    update = True
+
+    def terminalIds(self, tokens):
+        get = self.terminalIndex.get
+        if hasattr(tokens, "ids"):
+            ids = [get(name, 0) for name in tokens.names]
+            return list(map(ids.__getitem__, tokens.ids))
+        return [get(tok.name, 0) for tok in tokens]
+
+    def buildReduce(self):
+        self.ruleReduce = []
+        for rule in self.ruleList:
+            if rule.lhs in self.ignore:
+                mode = REDUCE_IGNORE
+            elif rule.lhs in self.expand:
+                mode = REDUCE_EXPAND
+            elif rule.lhs in self.expandSingle:
+                mode = REDUCE_SINGLE
+            else:
+                mode = REDUCE_NODE
+            plan = tuple((pos, sym in self.rules and sym in self.expand) for pos, sym in enumerate(rule.rhs) if sym not in self.ignore)
+            if len(plan) == len(rule.rhs) and not any(splice for pos, splice in plan):
+                plan = None
+            self.ruleReduce.append(None if mode == REDUCE_NODE and plan is None else (mode, plan))
+
+    def reduceTable(self, actions):
+        if actions is None:
+            return self.ruleReduce
+        return [(entry or (REDUCE_NODE, None)) if rule.lhs in actions else entry for rule, entry in zip(self.ruleList, self.ruleReduce)]
+
+    def shift(self, tok, actions):
+        if actions is None or tok.name not in actions or tok.name in self.ignore:
+            return tok
+        return actions[tok.name](tok)
+
+    def reduce(self, rule, children, actions=None):
+        lhs = self.ruleList[rule].lhs
+        mode, plan = self.ruleReduce[rule] or (REDUCE_NODE, None)
+        if mode == REDUCE_EXPAND:
+            return Expansion(list(children) if plan is None else [children[pos] for pos, splice in plan])
+        if plan is not None:
+            nchild = []
+            for pos, splice in plan:
+                if splice:
+                    nchild.extend(children[pos].values())
+                else:
+                    nchild.append(children[pos])
+            children = nchild
+        if mode == REDUCE_NODE or (mode == REDUCE_SINGLE and len(children) != 1):
+            if actions is not None and lhs in actions:
+                return actions[lhs](children)
+            return Node(lhs, children)
+        if mode == REDUCE_SINGLE:
+            return children[0]
+        return None
+
+    def parseIncremental(self, tokens, actions=None):
+        state = ParseState(tokens, actions)
+        state.tree = self.parse(tokens, actions)
+        return state
+
+    def reparse(self, state, first, removed, added):
+        state.tree = None
+        state.tree = self.parse(state.tokens, state.actions)
+        return state
+
+    def accept(self, value):
+        if self.start in self.ignore or (self.start in self.expand and value.size != 1):
+            raise RuntimeError("The simplified AST is not a tree.")
+        return value.values()[0] if self.start in self.expand else value
 
 class EarleyParser(Parser):
 
-    class State:
-
-        def __init__(self, rule, pos=0, orgi=0, node=None):
-            self.rule = rule
-            self.pos = pos
-            self.orgi = orgi
-            self.node = Node(rule.lhs, []) if node is None else node
-
-        def nextRHS(self):
-            return None if self.isComplete() else self.rule.rhs[self.pos]
-
-        def isComplete(self):
-            return self.pos == len(self.rule.rhs)
-
-        def advanced(self, nch):
-            return EarleyParser.State(self.rule, self.pos + 1, self.orgi, self.node.extended(nch))
-
-        def __str__(self):
-            return "(" + str(self.rule) + ":" + str(self.pos) + ":" + str(self.orgi) + ")"
-
-        def __eq__(self, obj):
-            return self.rule == obj.rule and self.orgi == obj.orgi and self.pos == obj.pos
-
-        def __hash__(self):
-            return hash((self.rule, self.pos, self.orgi))
+    ALGORITHM = "earley"
+
+    class Forest:
+
+        def __init__(self, parser, tokens, links, done, waits, predicted, bottoms):
+            self.parser = parser
+            self.tokens = tokens
+            self.links = links
+            self.done = done
+            self.waits = waits
+            self.predicted = predicted
+            self.bottoms = bottoms
+
+        def waiting(self, col, sym):
+            explicit = self.waits[col].get(sym, ())
+            return explicit[0] if len(explicit) > 0 else (self.predicted[col][2][sym][0], col)
+
+        def expandLeo(self, name, start, end):
+            itemLhs = self.parser.itemLhs
+            for sym, col in self.bottoms[end].pop((name, start), ()):
+                while (sym, col) != (name, start):
+                    item, orgi = self.waiting(col, sym)
+                    key = (item + 1, orgi)
+                    if key not in self.links[end]:
+                        self.links[end][key] = []
+                        self.done[end].setdefault((itemLhs[item], orgi), []).append(item + 1)
+                    if col not in self.links[end][key]:
+                        self.links[end][key].append(col)
+                    sym, col = itemLhs[item], orgi
+
+        def candidates(self, name, start, end):
+            if start == end:
+                return self.predicted[end][3].get(name, [])
+            self.expandLeo(name, start, end)
+            return self.done[end].get((name, start), [])
+
+        def mids(self, item, start, end):
+            return [end] if start == end else self.links[end][item, start]
+
+        def split(self, item, start, end):
+            first = self.parser.ruleStart[self.parser.itemRule[item]]
+            bounds = [end]
+            ambiguous = False
+            while item > first:
+                mids = self.mids(item, start, bounds[-1])
+                ambiguous = ambiguous or len(mids) > 1
+                bounds.append(mids[0])
+                item -= 1
+            return tuple(reversed(bounds)), ambiguous
+
+        def derivations(self, name, start, end):
+            parser = self.parser
+            result = []
+            for item in self.candidates(name, start, end):
+                rule = parser.ruleList[parser.itemRule[item]]
+                first = parser.ruleStart[parser.itemRule[item]]
+                que = [(item, (end,))]
+                while len(que) > 0:
+                    cur, bounds = que.pop()
+                    if cur == first:
+                        result.append((rule, bounds))
+                    else:
+                        que.extend((cur - 1, (mid,) + bounds) for mid in reversed(self.mids(cur, start, bounds[0])))
+            return result
+
+        def isAmbiguous(self):
+            for end, bottoms in enumerate(self.bottoms):
+                for name, start in list(bottoms):
+                    self.expandLeo(name, start, end)
+            return any(len(items) > 1 for done in self.done for items in done.values()) or \
+                any(len(items) > 1 for state in self.predicted for items in state[3].values()) or \
+                any(len(mids) > 1 for links in self.links for mids in links.values())
+
+        def tree(self, actions=None):
+            parser = self.parser
+            stack = []
+            task = (parser.start, 0, len(self.done) - 1, None)
+            while True:
+                if task is not None:
+                    name, start, end, chain = task
+                    items = self.candidates(name, start, end)
+                    rule = parser.itemRule[items[0]]
+                    bounds, ambiguous = self.split(items[0], start, end)
+                    if ambiguous or len(items) > 1:
+                        span = (name, start, end)
+                        link = chain
+                        while link is not None and link[0] != span:
+                            link = link[1]
+                        if link is None:
+                            rule, bounds = parser.disambiguate(name, start, end, self.derivations(name, start, end))
+                            rule = parser.ruleIndex[rule]
+                        chain = (span, chain)
+                    stack.append((rule, parser.ruleList[rule].rhs, bounds, [], chain))
+                    task = None
+                rule, rhs, bounds, values, chain = stack[-1]
+                while len(values) < len(rhs):
+                    pos = len(values)
+                    if rhs[pos] in parser.rules:
+                        task = (rhs[pos], bounds[pos], bounds[pos + 1], chain)
+                        break
+                    values.append(parser.shift(self.tokens[bounds[pos]], actions))
+                if task is not None:
+                    continue
+                stack.pop()
+                value = parser.reduce(rule, values, actions)
+                if len(stack) == 0:
+                    return value
+                stack[-1][3].append(value)
 
     def __init__(self, *args, **kargs):
         super().__init__(*args, **kargs)
-        self.chart = None
-        self.mchart = None
-        self.initState = self.State(self.initRule)
-
-    def parse(self, tokens):
-
-        self.chart = [[self.initState]]
-        self.mchart = [{self.initRule.rhs[0]: set([self.initState])}]
-        for pos in range(len(tokens) + 1):
-            self.chart.append([])
-            self.mchart.append({})
-
-            _idx = 0
-            while _idx < len(self.chart[pos]):
-                state = self.chart[pos][_idx]
-                _idx += 1
-
-                if state.isComplete():
-                    for _state in self.mchart[state.orgi].setdefault(state.rule.lhs, set()):
-                        self.add(_state.advanced(state.node), pos)
-
-                elif state.nextRHS() in self.rules:
-                    for rule in self.rules[state.nextRHS()]:
-                        self.add(self.State(rule, 0, pos), pos)
-
-                elif pos < len(tokens) and state.nextRHS() == tokens[pos].name:
-                    self.add(state.advanced(tokens[pos]), pos + 1)
-
-        for state in self.chart[len(tokens)]:
-            if state.isComplete() and state.rule.lhs == Parser.INIT_SYM:
-                result = self.flatten(state.node.child[0])
-                if len(result) != 1:
-                    raise RuntimeError("The simplified AST is not a tree.")
+        self.loadTables(())
+
+    def loadTables(self, tables):
+        self.encode()
+        self.buildReduce()
+        self.buildNullable()
+        self.itemLhs = [self.ruleList[rule].lhs for rule in self.itemRule]
+        self.itemTerminal = [0 if sym in self.rules else self.terminalIndex[sym] for sym in self.itemNext]
+        self.ruleIndex = dict((rule, idx) for idx, rule in reversed(list(enumerate(self.ruleList))))
+
+        self.blocks = {}
+        for lhs, starts in self.ruleItems.items():
+            waiting, completed = [], []
+            for item in starts:
+                while self.itemNext[item] is not None:
+                    waiting.append((self.itemNext[item], item))
+                    if self.itemNext[item] not in self.nullable:
+                        break
+                    item += 1
                 else:
-                    return result[0]
-        raise RuntimeError("Can't parse token stream.")
-
-    def add(self, state, pos):
-        if state not in self.mchart[pos].setdefault(state.nextRHS(), set()):
-            self.chart[pos].append(state)
-            self.mchart[pos][state.nextRHS()].add(state)
+                    completed.append(item)
+            if lhs in self.nullable:
+                completed.remove(self.nullable[lhs])
+                completed.insert(0, self.nullable[lhs])
+            self.blocks[lhs] = (waiting, completed)
+
+        self.predictSyms = {}
+        for lhs in self.rules:
+            que = [lhs]
+            seen = set(que)
+            for sym in que:
+                for _next, item in self.blocks[sym][0]:
+                    if _next in self.rules and _next not in seen:
+                        seen.add(_next)
+                        que.append(_next)
+            self.predictSyms[lhs] = que
+
+        self.predictStates = [((), frozenset(), {}, {}, {})]
+        self.predictIndex = {frozenset(): 0}
+        self.predictNext = {}
+        self.predictLock = threading.Lock()
+
+    def predict(self, state, sym):
+        syms, symSet = self.predictStates[state][:2]
+        if sym not in symSet:
+            syms = syms + tuple(_sym for _sym in self.predictSyms[sym] if _sym not in symSet)
+            symSet = frozenset(syms)
+        with self.predictLock:
+            if symSet not in self.predictIndex:
+                waits, done, scans = {}, {}, {}
+                for _sym in syms:
+                    waiting, completed = self.blocks[_sym]
+                    for _next, item in waiting:
+                        if _next in self.rules:
+                            waits.setdefault(_next, []).append(item)
+                        else:
+                            scans.setdefault(self.terminalIndex[_next], []).append(item)
+                    if len(completed) > 0:
+                        done[_sym] = completed
+                self.predictStates.append((syms, symSet, waits, done, scans))
+                self.predictIndex[symSet] = len(self.predictStates) - 1
+            self.predictNext[state, sym] = self.predictIndex[symSet]
+        return self.predictIndex[symSet]
+
+    def disambiguate(self, name, start, end, derivations):
+        return derivations[0]
+
+    def parse(self, tokens, actions=None):
+        return self.accept(self.parseForest(tokens).tree(actions))
+
+    def parseForest(self, tokens):
+
+        tokens = tokens if hasattr(tokens, "__len__") else list(tokens)
+        terms = self.terminalIds(tokens)
+        itemNext, itemLhs, itemTerminal, rules, nullable = self.itemNext, self.itemLhs, self.itemTerminal, self.rules, self.nullable
+        predictStates, predictNext = self.predictStates, self.predictNext
+        links = [{} for _ in range(len(terms) + 1)]
+        waits = [{} for _ in range(len(terms) + 1)]
+        done = [{} for _ in range(len(terms) + 1)]
+        predicted = [None] * (len(terms) + 1)
+        leo = [{} for _ in range(len(terms) + 1)]
+        bottoms = [{} for _ in range(len(terms) + 1)]
+
+        def transitive(col, sym):
+            chain = []
+            record = None
+            while True:
+                if sym in leo[col]:
+                    record = leo[col][sym]
+                    break
+                explicit, implicit = waits[col].get(sym, ()), predicted[col][2].get(sym, ())
+                if len(explicit) + len(implicit) != 1:
+                    leo[col][sym] = None
+                    break
+                item, orgi = explicit[0] if len(explicit) > 0 else (implicit[0], col)
+                if itemNext[item + 1] is not None:
+                    leo[col][sym] = None
+                    break
+                chain.append((col, sym, item, orgi))
+                if orgi == col:
+                    break
+                col, sym = orgi, itemLhs[item]
+            for col, sym, item, orgi in reversed(chain):
+                if record is None:
+                    record = (item + 1, orgi, col)
+                leo[col][sym] = record
+            return record
+
+        links[0][0, 0] = []
+        for pos in range(len(terms) + 1):
+            column, columnLinks, columnWaits, columnDone = list(links[pos]), links[pos], waits[pos], done[pos]
+            columnScans = {}
+            state = 0
+
+            for item, orgi in column:
+                sym = itemNext[item]
+                if sym is None:
+                    lhs = itemLhs[item]
+                    columnDone.setdefault((lhs, orgi), []).append(item)
+                    if orgi == pos:
+                        continue
+                    record = transitive(orgi, lhs)
+                    if record is None:
+                        advance = itertools.chain(waits[orgi].get(lhs, ()), zip(predicted[orgi][2].get(lhs, ()), itertools.repeat(orgi)))
+                        mid = orgi
+                    else:
+                        top, torgi, mid = record
+                        advance = ((top - 1, torgi),)
+                        bottom = bottoms[pos].setdefault((itemNext[top - 1], mid), [])
+                        if (lhs, orgi) not in bottom:
+                            bottom.append((lhs, orgi))
+                elif sym in rules:
+                    _state = predictNext.get((state, sym))
+                    state = self.predict(state, sym) if _state is None else _state
+                    columnWaits.setdefault(sym, []).append((item, orgi))
+                    advance, mid = ((item, orgi),) if sym in nullable else (), pos
+                else:
+                    columnScans.setdefault(itemTerminal[item], []).append((item, orgi))
+                    continue
+
+                for _item, _orgi in advance:
+                    key = (_item + 1, _orgi)
+                    if key not in columnLinks:
+                        columnLinks[key] = [mid]
+                        column.append(key)
+                    elif mid not in columnLinks[key]:
+                        columnLinks[key].append(mid)
+
+            predicted[pos] = predictStates[state]
+            if pos < len(terms):
+                nextLinks = links[pos + 1]
+                for item, orgi in columnScans.get(terms[pos], ()):
+                    nextLinks[item + 1, orgi] = [pos]
+                for item in predicted[pos][4].get(terms[pos], ()):
+                    nextLinks[item + 1, pos] = [pos]
+
+        if (1, 0) not in links[len(terms)]:
+            raise RuntimeError("Can't parse token stream.")
+        return self.Forest(self, tokens, links, done, waits, predicted, bottoms)
 
 class LR1Parser(Parser):
 
-    class Item:
-
-        def __init__(self, rule, pos=0, follow=None):
-            self.rule = rule
-            self.pos = pos
-            self.follow = follow
-
-        def isComplete(self):
-            return self.pos == len(self.rule.rhs)
-
-        def nextRHS(self):
-            return None if self.isComplete() else self.rule.rhs[self.pos]
-
-        def advanced(self):
-            return LR1Parser.Item(self.rule, self.pos + 1, self.follow)
-
-        def __hash__(self):
-            return hash((self.rule, self.pos, self.follow))
-
-        def __eq__(self, obj):
-            return self.rule == obj.rule and self.pos == obj.pos and self.follow == obj.follow
-
-        def __str__(self):
-            return "(" + str(self.rule) + ":" + str(self.pos) + ":" + str(self.follow) + ")"
-
-        def __repr__(self):
-            return str(self)
+    ALGORITHM = "lr1"
+    CONFLICT = "Not LR1"
+    PACK_WINDOW = 256
 
     def __init__(self, *args, **kargs):
         super().__init__(*args, **kargs)
-        self.initItem = self.Item(self.initRule)
-        self.build_first()
+        self.encode()
+        self.buildFirst()
+        self.buildDerives()
         self.build()
 
-    def build_first(self):
+    class StackEntry:
+
+        __slots__ = ("state", "value", "below", "depth", "rule", "top", "owned", "popper")
+
+        def __init__(self, state, value, below, depth, rule=None, top=None, owned=False):
+            self.state = state
+            self.value = value
+            self.below = below
+            self.depth = depth
+            self.rule = rule
+            self.top = top
+            self.owned = owned
+            self.popper = None
+
+    def buildFirst(self):
+        nullable = set()
+        firsts = dict((lhs, 0) for lhs in self.rules)
+
+        def firstOf(rhs):
+            first = 0
+            for sym in rhs:
+                if sym not in self.rules:
+                    return first | (1 << self.terminalIndex[sym]), False
+                first |= firsts[sym]
+                if sym not in nullable:
+                    return first, False
+            return first, True
+
         update = True
-        firsts = dict([(lhs, set()) for lhs in self.rules.keys()])
         while update:
             update = False
-            for lhs, rules in self.rules.items():
-                objSet = firsts[lhs]
-                for rule in rules:
-                    first_rhs = rule.rhs[0] if len(rule.rhs) > 0 else None
-                    if first_rhs in self.rules:
-                        if not firsts[first_rhs].issubset(objSet):
-                            update = True
-                            objSet.update(firsts[first_rhs])
-                    else:
-                        if first_rhs not in objSet:
-                            objSet.add(first_rhs)
-        self.firsts = firsts
-
-    def first_of(self, rhs):
-        ret = set([None])
-        for tok in rhs:
-            if None not in ret:
-                break
-            ret.remove(None)
-            if tok in self.firsts:
-                ret.update(self.firsts[tok])
-            else:
-                ret.add(tok)
-        return ret
-
-    def closure(self, itemSet):
-        que = list(itemSet)
-        while len(que) > 0:
-            _que, que = que, []
-            for item in _que:
-                if not item.isComplete() and item.nextRHS() in self.rules:
-                    follows = self.first_of(item.rule.rhs[item.pos+1:] + [item.follow])
-                    for rule in self.rules[item.nextRHS()]:
-                        for follow in follows:
-                            newItem = self.Item(rule, follow=follow)
-                            if newItem not in itemSet:
-                                itemSet.add(newItem)
-                                que.append(newItem)
-        return itemSet
+            for rule in self.orgiRules:
+                first, empty = firstOf(rule.rhs)
+                if first | firsts[rule.lhs] != firsts[rule.lhs]:
+                    firsts[rule.lhs] |= first
+                    update = True
+                if empty and rule.lhs not in nullable:
+                    nullable.add(rule.lhs)
+                    update = True
+
+        self.itemFirst = [0] * len(self.itemRule)
+        self.itemNullable = [True] * len(self.itemRule)
+        for idx, rule in enumerate(self.ruleList):
+            base = self.ruleStart[idx]
+            first, empty = 0, True
+            for pos in reversed(range(len(rule.rhs))):
+                self.itemFirst[base + pos], self.itemNullable[base + pos] = first, empty
+                sym = rule.rhs[pos]
+                if sym not in self.rules:
+                    first, empty = 1 << self.terminalIndex[sym], False
+                elif sym in nullable:
+                    first |= firsts[sym]
+                else:
+                    first, empty = firsts[sym], False
+
+    def buildDerives(self):
+        propagate = 1 << len(self.terminals)
+        self.derives = {}
+        for lhs in self.rules:
+            follows = {lhs: propagate}
+            que = [lhs]
+            for sym in que:
+                for start in self.ruleItems[sym]:
+                    if self.itemNext[start] not in self.rules:
+                        continue
+                    follow = self.itemFirst[start] | (follows[sym] if self.itemNullable[start] else 0)
+                    adj = self.itemNext[start]
+                    if adj not in follows or follows[adj] | follow != follows[adj]:
+                        follows[adj] = follows.get(adj, 0) | follow
+                        que.append(adj)
+            self.derives[lhs] = [(start, follow & ~propagate, follow & propagate != 0) for sym, follow in follows.items() for start in self.ruleItems[sym]]
+
+    def closure(self, kernel):
+        items = dict(kernel)
+        for item, follow in kernel.items():
+            if self.itemNext[item] in self.rules:
+                follow = self.itemFirst[item] | (follow if self.itemNullable[item] else 0)
+                for start, first, inherit in self.derives[self.itemNext[item]]:
+                    items[start] = items.get(start, 0) | (first | follow if inherit else first)
+        return items
+
+    def actions(self, items, error):
+        gotos = {}
+        reduceMap = {}
+        for item, follow in items.items():
+            if self.itemNext[item] is not None:
+                gotos.setdefault(self.itemNext[item], {})[item + 1] = follow
+                continue
+            rule = self.ruleList[self.itemRule[item]]
+            while follow:
+                bit = follow & -follow
+                reduceMap.setdefault(self.terminals[bit.bit_length() - 1], []).append(rule)
+                follow ^= bit
+        if error is not None and (any(len(rules) > 1 for rules in reduceMap.values()) or not reduceMap.keys().isdisjoint(gotos.keys())):
+            raise RuntimeError(error)
+        return gotos, reduceMap
 
     def build(self):
 
-        idx = 0
+        kernels = [((0, 1),)]
+        indexMap = {kernels[0]: 0}
         edges = []
         reduces = []
-        CCs = [self.closure(set([self.initItem]))]
-
-        while idx < len(CCs):
-
-            itemsMap = {}
-            reduceMap = {}
-            for item in CCs[idx]:
-                if not item.isComplete():
-                    rhs = item.nextRHS()
-                    if rhs not in itemsMap:
-                        itemsMap[rhs] = set()
-                    itemsMap[rhs].add(item.advanced())
-                else:
-                    if item.follow in reduceMap:
-                        raise RuntimeError("Not LR1")
-                    else:
-                        reduceMap[item.follow] = item.rule
-            for itemSet in itemsMap.values():
-                self.closure(itemSet)
-
-            for itemSet in itemsMap.values():
-                if itemSet not in CCs:
-                    CCs.append(itemSet)
-
+        idx = 0
+        while idx < len(kernels):
+            gotos, reduceMap = self.actions(self.closure(dict(kernels[idx])), self.CONFLICT)
             edges.append(dict())
-            for lhs, itemSet in itemsMap.items():
-                edges[-1][lhs] = CCs.index(itemSet)
+            for sym, kernel in gotos.items():
+                kernel = tuple(sorted(kernel.items()))
+                if kernel not in indexMap:
+                    indexMap[kernel] = len(kernels)
+                    kernels.append(kernel)
+                edges[-1][sym] = indexMap[kernel]
             reduces.append(reduceMap)
+            idx += 1
 
-            if not set(reduceMap.keys()).isdisjoint(set(itemsMap.keys())):
-                raise RuntimeError("Not LR1")
+        self.pack(edges, reduces)
+
+    def pack(self, edges, reduces):
+
+        symbolIndex = dict((sym, idx) for idx, sym in enumerate(self.terminals))
+        for edge in edges:
+            for sym in edge:
+                if sym in self.rules and sym not in symbolIndex:
+                    symbolIndex[sym] = len(symbolIndex)
+        self.symbolNames = list(symbolIndex)
+        ruleIndex = dict((id(rule), idx) for idx, rule in enumerate(self.ruleList))
+
+        rows = []
+        conflicts = []
+        for edge, reduceMap in zip(edges, reduces):
+            row = dict((symbolIndex[sym], [adj]) for sym, adj in edge.items())
+            for follow, rules in reduceMap.items():
+                row.setdefault(symbolIndex[follow], []).extend(-ruleIndex[id(rule)] - 1 for rule in rules)
+            for col, actions in row.items():
+                if len(actions) == 1:
+                    row[col] = actions[0]
+                else:
+                    row[col] = len(edges) + len(conflicts)
+                    conflicts.append(tuple(actions))
+            rows.append(sorted(row.items()))
+
+        base = [0] * len(rows)
+        table = []
+        check = []
+        free = 0
+        for state in sorted(range(len(rows)), key=lambda state: -len(rows[state])):
+            if len(rows[state]) == 0:
+                continue
+            while free < len(check) and check[free] >= 0:
+                free += 1
+            first = rows[state][0][0]
+            offset = max(0, len(check) - first)
+            for pos in range(max(free, first), min(len(check), free + self.PACK_WINDOW)):
+                if check[pos] < 0 and all(pos - first + col >= len(check) or check[pos - first + col] < 0 for col, value in rows[state]):
+                    offset = pos - first
+                    break
+            base[state] = offset
+            for col, value in rows[state]:
+                if offset + col >= len(check):
+                    table.extend([0] * (offset + col + 1 - len(check)))
+                    check.extend([-1] * (offset + col + 1 - len(check)))
+                table[offset + col] = value
+                check[offset + col] = state
+
+        size = max(base, default=0) + len(self.symbolNames) + 1
+        table.extend([0] * (size - len(table)))
+        check.extend([-1] * (size - len(check)))
+        self.loadPacked(self.symbolNames, base, table, check, conflicts)
+
+    def loadPacked(self, symbolNames, base, table, check, conflicts=()):
+        self.ruleList = [self.initRule] + self.orgiRules
+        self.symbolNames = list(symbolNames)
+        self.symbolIndex = dict((sym, idx) for idx, sym in enumerate(self.symbolNames))
+        self.states = len(base)
+        self.conflicts = [tuple(actions) for actions in conflicts]
+        self.base = array.array("i", base)
+        self.table = array.array("i", table)
+        self.check = array.array("i", check)
+        self.ruleLength = array.array("i", [len(rule.rhs) for rule in self.ruleList])
+        self.ruleLhs = array.array("i", [self.symbolIndex.get(rule.lhs, -1) for rule in self.ruleList])
+        self.buildReduce()
+
+    def toTables(self):
+        return super().toTables() + (tuple(self.symbolNames), tuple(self.base), tuple(self.table), tuple(self.check))
+
+    def loadTables(self, tables):
+        self.loadPacked(*tables)
+
+    def symbolTokens(self, tokens):
+        get, unknown = self.symbolIndex.get, len(self.symbolNames)
+        if hasattr(tokens, "ids"):
+            ids = list(map(get, tokens.names, itertools.repeat(unknown)))
+            symbols = map(ids.__getitem__, tokens.ids)
+        elif hasattr(tokens, "__len__"):
+            symbols = map(get, (tok.name for tok in tokens), itertools.repeat(unknown))
+        else:
+            return itertools.chain(((get(tok.name, unknown), tok) for tok in tokens), [(0, None)])
+        return zip(itertools.chain(symbols, [0]), itertools.chain(tokens, [None]))
+
+    def parse(self, tokens, actions=None):
+
+        base, table, check = self.base, self.table, self.check
+        ruleLength, ruleLhs, ruleList, ruleReduce = self.ruleLength, self.ruleLhs, self.ruleList, self.reduceTable(actions)
+        shifts = None if actions is None else [None if name in self.ignore else actions.get(name) for name in self.symbolNames]
+        states = [0]
+        values = []
+
+        for sym, tok in self.symbolTokens(tokens):
+            while True:
+                state = states[-1]
+                if check[base[state] + sym] != state:
+                    raise RuntimeError("Can't parse token stream.")
+                action = table[base[state] + sym]
+                if action >= 0:
+                    break
+                rule = -action - 1
+                if rule == 0:
+                    return self.accept(values[-1])
+                length = ruleLength[rule]
+                if length > 0:
+                    children = values[-length:]
+                    del values[-length:]
+                    del states[-length:]
+                else:
+                    children = []
+                if ruleReduce[rule] is None:
+                    values.append(Node(ruleList[rule].lhs, children))
+                else:
+                    values.append(self.reduce(rule, children, actions))
+                states.append(table[base[states[-1]] + ruleLhs[rule]])
+            states.append(action)
+            values.append(tok if shifts is None or shifts[sym] is None else shifts[sym](tok))
+        raise RuntimeError("Can't parse token stream.")
 
-            idx += 1
+    def parseIncremental(self, tokens, actions=None):
+        state = ParseState(tokens, actions)
+        state.tops = [self.StackEntry(0, None, None, 0)]
+        self.resume(state, 0)
+        return state
+
+    def reparse(self, state, first, removed, added):
+        try:
+            if state.tree is None:
+                state.tops = [self.StackEntry(0, None, None, 0)]
+                self.resume(state, 0)
+            else:
+                self.resume(state, first, added - removed, first + added)
+        except RuntimeError:
+            state.tree = None
+            raise
+        return state
+
+    def owns(self, rule, value, children, actions):
+        if actions is not None or type(value) is not Node:
+            return False
+        if self.ruleReduce[rule] is None or self.ruleReduce[rule][0] == REDUCE_NODE:
+            return True
+        return not any(value is child or (type(child) is Expansion and child.size == 1 and value is child.values()[0]) for child in children)
+
+    def rebuild(self, entry, actions):
+        children = [None] * self.ruleLength[entry.rule]
+        below = entry.top
+        for pos in reversed(range(len(children))):
+            children[pos] = below.value
+            below = below.below
+        value = self.reduce(entry.rule, children, actions)
+        owned = self.owns(entry.rule, value, children, actions)
+        if entry.owned and owned and entry.value.name == value.name:
+            entry.value.child = value.child
+            return False
+        entry.value, entry.owned = value, owned
+        return True
+
+    def resume(self, state, pos, shift=None, syncFrom=0):
+
+        tokens, tops, actions = state.tokens, state.tops, state.actions
+        base, table, check = self.base, self.table, self.check
+        ruleLength, ruleLhs, ruleList = self.ruleLength, self.ruleLhs, self.ruleList
+        symbols = [self.symbolIndex.get(name, len(self.symbolNames)) for name in tokens.names]
+        ids, count = tokens.ids, len(tokens)
+        StackEntry = self.StackEntry
+        begin, top = pos, tops[pos]
+        region = []
+        created = []
+        saved = {}
+
+        while True:
+            sym = symbols[ids[pos]] if pos < count else 0
+            while True:
+                if check[base[top.state] + sym] != top.state:
+                    raise RuntimeError("Can't parse token stream.")
+                action = table[base[top.state] + sym]
+                if action >= 0:
+                    break
+                rule = -action - 1
+                if rule == 0:
+                    del tops[begin + 1:]
+                    tops.extend(region)
+                    state.root = top
+                    state.tree = self.accept(top.value)
+                    return
+                children = [None] * ruleLength[rule]
+                below = top
+                for idx in reversed(range(len(children))):
+                    children[idx] = below.value
+                    below = below.below
+                value = self.reduce(rule, children, actions)
+                entry = StackEntry(table[base[below.state] + ruleLhs[rule]], value, below, below.depth + 1, rule, top, self.owns(rule, value, children, actions))
+                while top is not below:
+                    if top.popper is not None and top not in saved:
+                        saved[top] = top.popper
+                    top.popper = entry
+                    top = top.below
+                created.append(entry)
+                top = entry
+            top = StackEntry(action, self.shift(tokens[pos], actions), top, top.depth + 1)
+            created.append(top)
+            pos += 1
+            region.append(top)
+
+            if shift is None or pos < syncFrom or pos - shift >= len(tops):
+                continue
+            new, old = top, tops[pos - shift]
+            if new.depth != old.depth:
+                continue
+            pairs = []
+            while new is not old and new.state == old.state:
+                pairs.append((new, old))
+                new, old = new.below, old.below
+            if new is not old:
+                continue
+
+            mapping = dict((id(new), old) for new, old in pairs)
+            remap = lambda entry: mapping.get(id(entry), entry)
+            for new, old in pairs:
+                old.value, old.rule, old.top, old.owned = new.value, new.rule, remap(new.top), new.owned
+                if old in saved:
+                    old.popper = saved[old]
+            for entry in created:
+                entry.below, entry.top, entry.popper = remap(entry.below), remap(entry.top), remap(entry.popper)
+            for entry in saved:
+                entry.popper = remap(entry.popper)
+            tops[begin + 1:pos - shift] = map(remap, region[:-1])
+
+            dirty = [old for new, old in pairs]
+            floor = dirty[0].depth + 1
+            idx = 0
+            entry = None
+            while True:
+                if entry is None:
+                    while idx < len(dirty) and dirty[idx].depth >= floor:
+                        idx += 1
+                    if idx == len(dirty):
+                        break
+                    entry = dirty[idx]
+                if entry.popper is None:
+                    state.root = entry
+                    break
+                entry = entry.popper
+                floor = entry.depth
+                if not self.rebuild(entry, actions):
+                    entry = None
+            state.tree = self.accept(state.root.value)
+            return
+
+class LALRParser(LR1Parser):
+
+    ALGORITHM = "lalr"
+    CONFLICT = "Not LALR1"
 
-        self.edges = edges
-        self.reduces = reduces
+    def build(self):
 
-    def parse(self, tokens):
+        kernels = [(0,)]
+        indexMap = {kernels[0]: 0}
+        edges = []
+        idx = 0
+        while idx < len(kernels):
+            gotos, reduceMap = self.actions(self.closure(dict.fromkeys(kernels[idx], 0)), self.CONFLICT)
+            edges.append(dict())
+            for sym, kernel in gotos.items():
+                kernel = tuple(sorted(kernel))
+                if kernel not in indexMap:
+                    indexMap[kernel] = len(kernels)
+                    kernels.append(kernel)
+                edges[-1][sym] = indexMap[kernel]
+            idx += 1
 
-        stack = [0]
+        propagate = 1 << len(self.terminals)
+        closures = {}
+        lookaheads = [dict.fromkeys(kernel, 0) for kernel in kernels]
+        lookaheads[0][0] = 1
+        propagates = []
+        for idx, kernel in enumerate(kernels):
+            for item in kernel:
+                if item not in closures:
+                    closures[item] = self.closure({item: propagate})
+                targets = []
+                for _item, follow in closures[item].items():
+                    if self.itemNext[_item] is None:
+                        continue
+                    target = edges[idx][self.itemNext[_item]]
+                    lookaheads[target][_item + 1] |= follow & ~propagate
+                    if follow & propagate:
+                        targets.append((target, _item + 1))
+                if len(targets) > 0:
+                    propagates.append((idx, item, targets))
 
-        def reduceBy(lhs):
-            rule = self.reduces[stack[-1]][lhs]
-            chds = []
-            for i in range(len(rule.rhs)):
-                stack.pop()
-                chds.append(stack.pop())
-            assert rule.lhs in self.edges[stack[-1]]
-            obj = self.edges[stack[-1]][rule.lhs]
-            stack.append(Node(rule.lhs, reversed(chds)))
-            stack.append(obj)
-
-        for tok in tokens:
-            while tok.name in self.reduces[stack[-1]]:
-                reduceBy(tok.name)
-            if tok.name in self.edges[stack[-1]]:
-                obj = self.edges[stack[-1]][tok.name]
-                stack.append(tok)
-                stack.append(obj)
-            else:
+        update = True
+        while update:
+            update = False
+            for idx, item, targets in propagates:
+                follow = lookaheads[idx][item]
+                for target, _item in targets:
+                    if lookaheads[target][_item] | follow != lookaheads[target][_item]:
+                        lookaheads[target][_item] |= follow
+                        update = True
+
+        self.pack(edges, [self.actions(self.closure(lookahead), self.CONFLICT)[1] for lookahead in lookaheads])
+
+class GLRParser(LR1Parser):
+
+    ALGORITHM = "glr"
+
+    class StackNode:
+
+        __slots__ = ("state", "links")
+
+        def __init__(self, state, links):
+            self.state = state
+            self.links = links
+
+    parseIncremental = Parser.parseIncremental
+    reparse = Parser.reparse
+
+    def actions(self, items, error):
+        return super().actions(items, None)
+
+    def toTables(self):
+        return super().toTables() + (tuple(self.conflicts),)
+
+    @classmethod
+    def paths(cls, node, length, via=None):
+        layer = {(node, via is None): []}
+        for _ in range(length):
+            nextLayer = {}
+            for (node, used), children in layer.items():
+                for link in node.links:
+                    key = (link[0], used or link is via)
+                    if key not in nextLayer:
+                        nextLayer[key] = [link[1]] + children
+            layer = nextLayer
+        return [(node, children) for (node, used), children in layer.items() if used]
+
+    def parse(self, tokens, actions=None):
+
+        base, table, check, conflicts, states = self.base, self.table, self.check, self.conflicts, self.states
+        ruleLength, ruleLhs = self.ruleLength, self.ruleLhs
+        StackNode = self.StackNode
+        frontier = [StackNode(0, [])]
+
+        for sym, tok in self.symbolTokens(tokens):
+
+            value = tok if actions is None or tok is None else self.shift(tok, actions)
+            shifted = False
+            while len(frontier) == 1:
+                node = frontier[0]
+                if check[base[node.state] + sym] != node.state:
+                    raise RuntimeError("Can't parse token stream.")
+                action = table[base[node.state] + sym]
+                if action >= states:
+                    break
+                if action >= 0:
+                    frontier = [StackNode(action, [(node, value)])]
+                    shifted = True
+                    break
+                rule = -action - 1
+                children = [None] * ruleLength[rule]
+                for pos in reversed(range(ruleLength[rule])):
+                    if len(node.links) != 1:
+                        break
+                    children[pos] = node.links[0][1]
+                    node = node.links[0][0]
+                else:
+                    if rule == 0:
+                        return self.accept(children[0])
+                    target = table[base[node.state] + ruleLhs[rule]]
+                    frontier = [StackNode(target, [(node, self.reduce(rule, children, actions))])]
+                    continue
+                break
+            if shifted:
+                continue
+
+            level = dict((node.state, node) for node in frontier)
+            linked = set((node.state, link[0]) for node in frontier for link in node.links)
+            que = [(node, None) for node in frontier]
+            done = []
+            shifts = {}
+            accepted = []
+            for node, via in que:
+                if via is None:
+                    done.append(node)
+                if check[base[node.state] + sym] != node.state:
+                    continue
+                action = table[base[node.state] + sym]
+                for action in conflicts[action - states] if action >= states else (action,):
+                    if action >= 0:
+                        if via is None:
+                            shifts.setdefault(action, []).append((node, value))
+                        continue
+                    rule = -action - 1
+                    for _node, children in self.paths(node, ruleLength[rule], via):
+                        if rule == 0:
+                            accepted.append(children[0])
+                            continue
+                        target = table[base[_node.state] + ruleLhs[rule]]
+                        if (target, _node) in linked:
+                            continue
+                        linked.add((target, _node))
+                        link = (_node, self.reduce(rule, children, actions))
+                        if target not in level:
+                            level[target] = StackNode(target, [link])
+                            que.append((level[target], None))
+                        else:
+                            level[target].links.append(link)
+                            que.extend((node, link) for node in done)
+
+            if len(accepted) > 0:
+                return self.accept(accepted[0])
+            if len(shifts) == 0:
                 raise RuntimeError("Can't parse token stream.")
+            frontier = [StackNode(target, links) for target, links in shifts.items()]
 
-        while None in self.reduces[stack[-1]]:
-            if self.reduces[stack[-1]][None] == self.initRule:
-                result = self.flatten(stack[-2])
-                if len(result) != 1:
-                    raise RuntimeError("The simplified AST is not a tree.")
-                else:
-                    return result[0]
-            else:
-                reduceBy(None)
         raise RuntimeError("Can't parse token stream.")
+
+PARSERS = {
+    "EarleyParser": EarleyParser,
+    "LR1Parser": LR1Parser,
+    "LALRParser": LALRParser,
+    "GLRParser": GLRParser,
+}
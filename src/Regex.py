@@ -1,17 +1,70 @@
 #!/usr/bin/python3
 
+import array
+import bisect
+import re
+
+MAX_CODE = 0x10FFFF
+
+def toRanges(ranges):
+    ret = []
+    for lo, hi in sorted(ranges):
+        if lo > hi:
+            continue
+        if len(ret) > 0 and lo <= ret[-1][1] + 1:
+            ret[-1] = (ret[-1][0], max(ret[-1][1], hi))
+        else:
+            ret.append((lo, hi))
+    return tuple(ret)
+
+def inRanges(ranges, code):
+    idx = bisect.bisect_right(ranges, (code, MAX_CODE))
+    return idx > 0 and ranges[idx-1][1] >= code
+
+def universeOf(charset):
+    return ((0, MAX_CODE),) if charset is None else toRanges((ord(ch), ord(ch)) for ch in charset)
+
+def intersectRanges(ranges, universe):
+    ret = []
+    for lo, hi in ranges:
+        for _lo, _hi in universe:
+            if max(lo, _lo) <= min(hi, _hi):
+                ret.append((max(lo, _lo), min(hi, _hi)))
+    return toRanges(ret)
+
+def subtractRanges(universe, ranges):
+    ret = []
+    for lo, hi in universe:
+        for _lo, _hi in ranges:
+            if _hi < lo or _lo > hi:
+                continue
+            if _lo > lo:
+                ret.append((lo, _lo - 1))
+            lo = _hi + 1
+        ret.append((lo, hi))
+    return toRanges(ret)
+
 class SimpleNFA:
 
     class Node:
 
-        def __init__(self, tran=lambda x: None, link=None):
-            self.tran = tran
+        def __init__(self, ranges=None, reverse=False, target=None, link=None):
+            self.ranges = ranges
+            self.reverse = reverse
+            self.target = target
             self.link = link if link else set()
 
-    def __init__(self, accepts=set(), reverse=False):
+        def tran(self, code):
+            if self.ranges is None or code is None or not (self.reverse ^ inRanges(self.ranges, code)):
+                return None
+            return self.target
+
+    def __init__(self, accepts=set(), reverse=False, ranges=None):
+        if ranges is None:
+            ranges = [(ord(ch), ord(ch)) for ch in accepts]
         accept = self.Node()
         self.accept = accept
-        self.start = self.Node(lambda x: accept if reverse ^ (x in accepts) else None)
+        self.start = self.Node(toRanges(ranges), reverse, accept)
 
     def star(self):
         nstart = self.Node(link=set([self.start]))
@@ -67,124 +120,303 @@ class SimpleNFA:
         return cls.expand(filter(lambda x: x is not None, map(lambda nd: nd.tran(ch), nodes)))
 
     def init(self):
-        self.cur = self.startState()
+        return self.startState()
 
-    def shift(self, ch):
-        self.cur = self.move(self.cur, ch)
+    def shift(self, cur, ch):
+        return self.move(cur, ord(ch))
 
-    def isAccept(self):
-        return self.accept in self.cur
+    def isAccept(self, cur):
+        return self.accept in cur
 
     def willAccept(self, obj):
         return self.accept in obj
 
+    def charsets(self):
+        ret = set()
+        visit = set([self.start])
+        que = [self.start]
+        while len(que) > 0:
+            cur = que.pop()
+            if cur.ranges is not None:
+                ret.add(cur.ranges)
+            for adj in list(cur.link) + [cur.target]:
+                if adj is not None and adj not in visit:
+                    visit.add(adj)
+                    que.append(adj)
+        return ret
+
     @classmethod
     def fromRegex(cls, config):
+        return cls.fromTree(parseRegex(config))
 
-        idx = 0
-        stk = []
-
-        def shift():
-            tmp = []
-            while len(stk) > 0 and stk[-1] != "(" and stk[-1] != "|":
-                tmp.append(stk.pop())
-            nfa = tmp.pop()
-            while len(tmp) > 0:
-                nfa.concat(tmp.pop())
-            if len(stk) > 0 and stk[-1] == "|":
-                stk.pop()
-                nfa.union(stk.pop())
+    @classmethod
+    def fromTree(cls, tree):
+        if tree[0] == "set":
+            return cls(reverse=tree[2], ranges=tree[1])
+        if tree[0] == "cat":
+            nfa = cls.fromTree(tree[1][0])
+            for child in tree[1][1:]:
+                nfa.concat(cls.fromTree(child))
             return nfa
+        if tree[0] == "alt":
+            return cls.fromTree(tree[2]).union(cls.fromTree(tree[1]))
+        return getattr(cls.fromTree(tree[1]), tree[0])()
 
-        while idx < len(config):
+def parseRegex(config):
 
-            if config[idx] == "\\":
-                stk.append(SimpleNFA(config[idx+1]))
-                idx += 2
+    idx = 0
+    stk = []
 
-            elif config[idx] == "*":
-                stk[-1].star()
-                idx += 1
-            elif config[idx] == "+":
-                stk[-1].plus()
-                idx += 1
-            elif config[idx] == "?":
-                stk[-1].maybe()
-                idx += 1
+    def shift():
+        tmp = []
+        while len(stk) > 0 and stk[-1] != "(" and stk[-1] != "|":
+            tmp.append(stk.pop())
+        tree = tmp[0] if len(tmp) == 1 else ("cat", tmp[::-1])
+        if len(stk) > 0 and stk[-1] == "|":
+            stk.pop()
+            tree = ("alt", stk.pop(), tree)
+        return tree
 
-            elif config[idx] == ".":
-                stk.append(SimpleNFA(set(), True))
-                idx += 1
+    while idx < len(config):
 
-            elif config[idx] == "(":
-                stk.append("(")
-                idx += 1
+        if config[idx] == "\\":
+            stk.append(("set", ((ord(config[idx+1]), ord(config[idx+1])),), False))
+            idx += 2
 
-            elif config[idx] == "|":
-                nfa = shift()
-                stk.append(nfa)
-                stk.append("|")
-                idx += 1
+        elif config[idx] == "*":
+            stk[-1] = ("star", stk[-1])
+            idx += 1
+        elif config[idx] == "+":
+            stk[-1] = ("plus", stk[-1])
+            idx += 1
+        elif config[idx] == "?":
+            stk[-1] = ("maybe", stk[-1])
+            idx += 1
 
-            elif config[idx] == ")":
-                nfa = shift()
-                if len(stk) > 0:
-                    stk[-1] = nfa
-                else:
-                    stk.append(nfa)
-                idx += 1
+        elif config[idx] == ".":
+            stk.append(("set", (), True))
+            idx += 1
+
+        elif config[idx] == "(":
+            stk.append("(")
+            idx += 1
+
+        elif config[idx] == "|":
+            tree = shift()
+            stk.append(tree)
+            stk.append("|")
+            idx += 1
 
-            elif config[idx] == "[":
+        elif config[idx] == ")":
+            tree = shift()
+            if len(stk) > 0:
+                stk[-1] = tree
+            else:
+                stk.append(tree)
+            idx += 1
+
+        elif config[idx] == "[":
+
+            if config[idx+1] == "^":
+                nega = True
+                idx += 2
+            else:
+                nega = False
+                idx += 1
 
-                if config[idx+1] == "^":
-                    nega = True
+            ranges = []
+            while config[idx] != "]":
+                if config[idx] == "-" and config[idx+1] != "]" and len(ranges) > 0:
+                    if ranges[-1][1] < ord(config[idx+1]):
+                        ranges.append((ranges[-1][1]+1, ord(config[idx+1])))
                     idx += 2
                 else:
-                    nega = False
+                    ranges.append((ord(config[idx]), ord(config[idx])))
                     idx += 1
+            idx += 1
 
-                chars = []
-                while config[idx] != "]":
-                    if config[idx] == "-" and config[idx+1] != "]" and len(chars) > 0:
-                        for code in range(ord(chars[-1])+1, ord(config[idx+1])+1):
-                            chars.append(chr(code))
-                        idx += 2
-                    else:
-                        chars.append(config[idx])
-                        idx += 1
-                idx += 1
-
-                stk.append(SimpleNFA(set(chars), nega))
+            stk.append(("set", toRanges(ranges), nega))
             
-            else:
-                stk.append(SimpleNFA(config[idx]))
-                idx += 1
+        else:
+            stk.append(("set", ((ord(config[idx]), ord(config[idx])),), False))
+            idx += 1
+
+    tree = shift()
+    assert len(stk) == 0
+    return tree
+
+def patternChar(code):
+    if 32 < code < 127:
+        return re.escape(chr(code))
+    return "\\x{0:02x}".format(code) if code < 0x100 else "\\u{0:04x}".format(code) if code < 0x10000 else "\\U{0:08x}".format(code)
+
+def charClass(ranges):
+    if len(ranges) == 0:
+        return "(?!)"
+    if len(ranges) == 1 and ranges[0][0] == ranges[0][1]:
+        return patternChar(ranges[0][0])
+    return "[" + "".join(patternChar(lo) if lo == hi else patternChar(lo) + "-" + patternChar(hi) for lo, hi in ranges) + "]"
+
+def toPattern(tree, universe):
+
+    sets = []
+    follows = []
+
+    def visit(tree):
+        if tree[0] == "set":
+            ranges = subtractRanges(universe, tree[1]) if tree[2] else intersectRanges(tree[1], universe)
+            sets.append(ranges)
+            follows.append(set())
+            return charClass(ranges), False, [len(sets) - 1], [len(sets) - 1]
+
+        if tree[0] == "cat":
+            pattern, nullable, first, last = "", True, [], []
+            for child in tree[1]:
+                _pattern, _nullable, _first, _last = visit(child)
+                for pos in last:
+                    follows[pos].update(_first)
+                pattern += _pattern
+                first = first + _first if nullable else first
+                last = last + _last if _nullable else _last
+                nullable = nullable and _nullable
+            return pattern, nullable, first, last
+
+        if tree[0] == "alt":
+            lhs, rhs = visit(tree[1]), visit(tree[2])
+            if lhs[1] or rhs[1]:
+                raise ValueError("nullable alternative")
+            return "(?:" + lhs[0] + "|" + rhs[0] + ")", False, lhs[2] + rhs[2], lhs[3] + rhs[3]
+
+        pattern, nullable, first, last = visit(tree[1])
+        if nullable:
+            raise ValueError("nullable repetition")
+        if tree[0] != "maybe":
+            for pos in last:
+                follows[pos].update(first)
+        pattern = pattern if tree[1][0] in ("set", "alt") else "(?:" + pattern + ")"
+        return pattern + {"star": "*", "plus": "+", "maybe": "?"}[tree[0]], tree[0] != "plus", first, last
+
+    try:
+        pattern, nullable, first, last = visit(tree)
+    except ValueError:
+        return None
+    if nullable:
+        return None
+
+    for positions in [first] + follows:
+        bounds = sorted(bound for pos in positions for bound in sets[pos])
+        if any(bounds[idx][0] <= bounds[idx-1][1] for idx in range(1, len(bounds))):
+            return None
+    return pattern, toRanges(bound for pos in first for bound in sets[pos])
+
+class Alphabet:
+
+    TABLE_SIZE = 256
+
+    def __init__(self, charset, nfas):
+        universe = universeOf(charset)
+        rangesets = set()
+        for nfa in nfas:
+            rangesets.update(nfa.charsets())
+        rangesets = [universe] + list(rangesets)
+
+        bounds = set([0])
+        for ranges in rangesets:
+            for lo, hi in ranges:
+                bounds.add(lo)
+                if hi < MAX_CODE:
+                    bounds.add(hi+1)
+        bounds = sorted(bounds)
+
+        marks = [[] for bound in bounds]
+        for idx, ranges in enumerate(rangesets):
+            for lo, hi in ranges:
+                for interval in range(bisect.bisect_left(bounds, lo), bisect.bisect_right(bounds, hi)):
+                    marks[interval].append(idx)
+
+        indexMap = {}
+        self.bounds = []
+        self.classes = []
+        self.reprs = []
+        for bound, mark in zip(bounds, marks):
+            ident = tuple(mark) if len(mark) > 0 and mark[0] == 0 else None
+            if ident not in indexMap:
+                indexMap[ident] = len(indexMap)
+                self.reprs.append(None if ident is None else bound)
+            if len(self.classes) == 0 or self.classes[-1] != indexMap[ident]:
+                self.bounds.append(bound)
+                self.classes.append(indexMap[ident])
+        self.buildTable()
+
+    class Translation(dict):
+
+        def __init__(self, alphabet):
+            self.alphabet = alphabet
+
+        def __missing__(self, code):
+            self[code] = chr(self.alphabet.classOfCode(code))
+            return self[code]
+
+    def buildTable(self):
+        self.table = [self.classes[bisect.bisect_right(self.bounds, code) - 1] for code in range(self.TABLE_SIZE)]
+        self.translation = self.Translation(self) if len(self.reprs) < 256 else None
+        self.byteTranslation = bytes(self.table) if len(self.reprs) < 256 else None
+
+    def classOfCode(self, code):
+        if code < self.TABLE_SIZE:
+            return self.table[code]
+        return self.classes[bisect.bisect_right(self.bounds, code) - 1]
+
+    def classOf(self, ch):
+        return self.classOfCode(ord(ch))
+
+    def translate(self, string):
+        if self.translation is not None:
+            return string.translate(self.translation).encode("latin-1")
+        return array.array("i", map(self.classOfCode, map(ord, string)))
+
+    def translateBytes(self, data):
+        if self.byteTranslation is not None:
+            return bytes(data).translate(self.byteTranslation)
+        return array.array("i", map(self.table.__getitem__, bytes(data)))
+
+    def __len__(self):
+        return len(self.reprs)
+
+    def __eq__(self, obj):
+        return self.bounds == obj.bounds and self.classes == obj.classes and self.reprs == obj.reprs
+
+    def toTables(self):
+        return (tuple(self.bounds), tuple(self.classes), tuple(self.reprs))
 
-        nfa = shift()
-        assert len(stk) == 0
-        return nfa
+    @classmethod
+    def fromTables(cls, tables):
+        alphabet = cls.__new__(cls)
+        alphabet.bounds, alphabet.classes, alphabet.reprs = map(list, tables)
+        alphabet.buildTable()
+        return alphabet
 
 class DFA:
 
-    def __init__(self, edges, accepts):
+    def __init__(self, edges, accepts, alphabet):
         self.edges = edges
         self.accepts = accepts
-        self.charset = set(edges[0].keys())
-        for es in edges[1:]:
-            assert self.charset == set(es.keys())
+        self.alphabet = alphabet
+        for es in edges:
+            assert len(es) == len(alphabet)
 
     def __repr__(self):
         return "{e:" + str(self.edges) + ", ac:" + str(self.accepts) + "}"
 
     def init(self):
-        self.cur = 0
-    def shift(self, ch):
-        self.cur = self.edges[self.cur][ch]
-    def isAccept(self):
-        return self.cur in self.accepts
+        return 0
+    def shift(self, cur, ch):
+        return self.edges[cur][self.alphabet.classOf(ch)]
+    def isAccept(self, cur):
+        return cur in self.accepts
 
     @classmethod
-    def fromNFA(cls, nfa, charset):
+    def fromNFA(cls, nfa, alphabet):
 
         idx = 0
         que = [nfa.startState()]
@@ -196,36 +428,36 @@ class DFA:
             cur = que[idx]
             if nfa.willAccept(cur):
                 accepts.append(idx)
-            edges.append(dict())
-            for ch in charset:
+            edges.append([])
+            for ch in alphabet.reprs:
                 adj = SimpleNFA.move(cur, ch)
                 if adj not in indexMap:
                     indexMap[adj] = len(indexMap)
                     que.append(adj)
-                edges[-1][ch] = indexMap[adj]
+                edges[-1].append(indexMap[adj])
             idx += 1
 
-        return DFA(edges, accepts)
+        return DFA(edges, accepts, alphabet)
 
 class LDFA:
 
-    def __init__(self, dfas, edges, labels, charset):
+    def __init__(self, dfas, edges, labels, alphabet):
         self.dfas = dfas
         self.edges = edges
         self.labels = labels
-        self.charset = charset
+        self.alphabet = alphabet
 
     def __repr__(self):
         return "{e:" + str(self.edges) + ", lb:" + str(self.labels) + "}"
 
     def init(self):
-        self.cur = 0
-    def shift(self, ch):
-        self.cur = self.edges[self.cur][ch]
-    def label(self):
-        return self.labels[self.cur]
-    def sinked(self):
-        return self.cur == self.sink
+        return 0
+    def shift(self, cur, ch):
+        return self.edges[cur][self.alphabet.classOf(ch)]
+    def label(self, cur):
+        return self.labels[cur]
+    def sinked(self, cur):
+        return cur == self.sink
 
     def merge(self, obj):
 
@@ -234,18 +466,17 @@ class LDFA:
         indexMap = {que[0]:0}
         nedges = []
         nlabels = []
-        assert self.charset == obj.charset
+        assert self.alphabet == obj.alphabet
 
         while idx < len(que):
             cur = que[idx]
             idx += 1
-            nedges.append({})
-            for ch in self.charset:
-                nex = (self.edges[cur[0]][ch], obj.edges[cur[1]][ch])
+            nedges.append([])
+            for nex in zip(self.edges[cur[0]], obj.edges[cur[1]]):
                 if nex not in indexMap:
                     indexMap[nex] = len(indexMap)
                     que.append(nex)
-                nedges[-1][ch] = indexMap[nex]
+                nedges[-1].append(indexMap[nex])
             nlabels.append(self.labels[cur[0]] if obj.labels[cur[1]] == 0 else obj.labels[cur[1]] + len(self.dfas))
 
         self.dfas += obj.dfas
@@ -254,45 +485,228 @@ class LDFA:
 
     def minimize(self):
 
-        group = self.labels[:]
-        def getIdent(idx):
-            return (group[idx], tuple(map(lambda ch: group[self.edges[idx][ch]], self.charset)))
-
-        while True:
-            ngroup = []
-            indexMap = {}
-            for ident in map(getIdent, range(len(self.edges))):
-                if ident not in indexMap:
-                    indexMap[ident] = len(indexMap)
-                ngroup.append(indexMap[ident])
-            if ngroup == group:
-                break
-            else:
-                group = ngroup
+        size = len(self.edges)
+        nclasses = len(self.alphabet)
+        inverse = [[[] for idx in range(size)] for cls in range(nclasses)]
+        for idx, es in enumerate(self.edges):
+            for cls, adj in enumerate(es):
+                inverse[cls][adj].append(idx)
+
+        indexMap = {}
+        blocks = []
+        group = []
+        for label in self.labels:
+            if label not in indexMap:
+                indexMap[label] = len(blocks)
+                blocks.append(set())
+            group.append(indexMap[label])
+        for idx in range(size):
+            blocks[group[idx]].add(idx)
+
+        largest = max(range(len(blocks)), key=lambda blk: len(blocks[blk]))
+        que = [(blk, cls) for blk in range(len(blocks)) if blk != largest for cls in range(nclasses)]
+        inQue = set(que)
+        while len(que) > 0:
+            splitter = que.pop()
+            inQue.remove(splitter)
+            blk, cls = splitter
+
+            touched = {}
+            for adj in blocks[blk]:
+                for idx in inverse[cls][adj]:
+                    touched.setdefault(group[idx], set()).add(idx)
+
+            for old, members in touched.items():
+                if len(members) == len(blocks[old]):
+                    continue
+                new = len(blocks)
+                blocks[old] -= members
+                blocks.append(members)
+                for idx in members:
+                    group[idx] = new
+                for _cls in range(nclasses):
+                    if (old, _cls) in inQue or len(members) <= len(blocks[old]):
+                        que.append((new, _cls))
+                        inQue.add((new, _cls))
+                    else:
+                        que.append((old, _cls))
+                        inQue.add((old, _cls))
+
+        indexMap = {}
+        for idx in range(size):
+            if group[idx] not in indexMap:
+                indexMap[group[idx]] = len(indexMap)
+        group = [indexMap[grp] for grp in group]
 
         groups = [[] for x in range(max(group)+1)]
         for i in range(len(group)):
             groups[group[i]].append(i)
 
-        nedges = list(map(lambda grp: dict(map(lambda ch: (ch, group[self.edges[grp[0]][ch]]), self.charset)), groups))
+        nedges = list(map(lambda grp: list(map(lambda adj: group[adj], self.edges[grp[0]])), groups))
         nlabels = list(map(lambda grp: self.labels[grp[0]], groups))
 
         self.edges = nedges
         self.labels = nlabels
+        self.sink = None
         for idx in range(len(self.edges)):
-            if self.labels[idx] == 0 and all(map(lambda x: x == idx, self.edges[idx].values())):
+            if self.labels[idx] == 0 and all(map(lambda x: x == idx, self.edges[idx])):
                 self.sink = idx
+        self.pack()
+
+    def pack(self):
+        nclasses = len(self.alphabet)
+        self.table = array.array("i", [adj * nclasses for es in self.edges for adj in es])
+        self.labelTable = array.array("i", [label for label in self.labels for cls in range(nclasses)])
+
+    def toSource(self, name="match", maxDepth=24):
+
+        bounds = self.alphabet.bounds + [MAX_CODE + 1]
+        classRanges = [[] for cls in range(len(self.alphabet))]
+        for idx, cls in enumerate(self.alphabet.classes):
+            classRanges[cls].append((bounds[idx], bounds[idx+1] - 1))
+
+        targets = []
+        incoming = [0] * len(self.edges)
+        for cur, es in enumerate(self.edges):
+            ranges = {}
+            for cls, adj in enumerate(es):
+                if adj != self.sink:
+                    ranges.setdefault(adj, []).extend(classRanges[cls])
+            targets.append(dict((adj, toRanges(rs)) for adj, rs in ranges.items()))
+            for adj in targets[-1]:
+                if adj != cur:
+                    incoming[adj] += 1
+
+        def test(ranges, var):
+            singles = "".join(chr(lo) for lo, hi in ranges if lo == hi)
+            tests = ["{0} in {1!r}".format(var, singles) if len(singles) > 1 else "{0} == {1!r}".format(var, singles)] if singles else []
+            for lo, hi in ranges:
+                if lo == 0 and hi < MAX_CODE:
+                    tests.append("{0} <= {1!r}".format(var, chr(hi)))
+                elif lo > 0 and hi == MAX_CODE:
+                    tests.append("{0} >= {1!r}".format(var, chr(lo)))
+                elif lo < hi:
+                    tests.append("{0!r} <= {1} <= {2!r}".format(chr(lo), var, chr(hi)))
+            return " or ".join(tests) if tests else "True"
+
+        entries = [0]
+        jumps = set()
+        inlined = set()
+        def emit(cur, indent, depth):
+            pad = "    " * indent
+            lines = []
+            edges = targets[cur]
+            if cur in edges:
+                lines.append(pad + "while idx < length:")
+                lines.append(pad + "    ch = text[idx]")
+                lines.append(pad + "    if not ({0}):".format(test(edges[cur], "ch")))
+                lines.append(pad + "        break")
+                lines.append(pad + "    idx += 1")
+                if self.labels[cur] and cur == 0:
+                    lines.append(pad + "if idx > cut:")
+                    lines.append(pad + "    label, cut = {0}, idx".format(self.labels[cur]))
+                elif self.labels[cur]:
+                    lines.append(pad + "label, cut = {0}, idx".format(self.labels[cur]))
+            others = [adj for adj in edges if adj != cur]
+            if len(others) == 0:
+                lines.append(pad + "return label, cut")
+                return lines
+            lines.append(pad + "if idx == length:")
+            lines.append(pad + "    return label, cut")
+            lines.append(pad + "ch = text[idx]")
+            for idx, adj in enumerate(others):
+                lines.append(pad + ("if " if idx == 0 else "elif ") + test(edges[adj], "ch") + ":")
+                if self.labels[adj] and len(targets[adj]) == 0:
+                    lines.append(pad + "    return {0}, idx + 1".format(self.labels[adj]))
+                    continue
+                lines.append(pad + "    idx += 1")
+                if self.labels[adj]:
+                    lines.append(pad + "    label = {0}".format(self.labels[adj]))
+                    lines.append(pad + "    cut = idx")
+                if incoming[adj] == 1 and adj != 0 and depth < maxDepth and adj not in inlined:
+                    inlined.add(adj)
+                    lines.extend(emit(adj, indent + 1, depth + 1))
+                else:
+                    if adj not in entries:
+                        entries.append(adj)
+                    jumps.add(adj)
+                    lines.append(pad + "    state = {0}".format(adj))
+                    lines.append(pad + "    continue")
+            lines.append(pad + "return label, cut")
+            return lines
+
+        blocks = {}
+        idx = 0
+        while idx < len(entries):
+            blocks[entries[idx]] = emit(entries[idx], 0, 0)
+            idx += 1
+
+        def dispatch(states, indent):
+            pad = "    " * indent
+            if len(states) <= 4:
+                lines = []
+                for idx, cur in enumerate(states):
+                    lines.append(pad + ("if state == {0}:" if idx == 0 else "elif state == {0}:").format(cur) if idx < len(states) - 1 or idx == 0 else pad + "else:")
+                    lines.extend(pad + "    " + line for line in blocks[cur])
+                return lines
+            mid = len(states) // 2
+            return [pad + "if state < {0}:".format(states[mid])] + dispatch(states[:mid], indent + 1) + [pad + "else:"] + dispatch(states[mid:], indent + 1)
+
+        lines = ["def {0}(text, idx, length):".format(name), "    label = 0", "    cut = idx"]
+        if len(jumps) == 0:
+            lines.extend("    " + line for line in blocks[0])
+        else:
+            lines += ["    state = 0", "    while True:"]
+            lines.extend("        " + line for line in dispatch(sorted(entries), 0))
+        return "\n".join(lines) + "\n"
+
+    def toTables(self):
+        edges = tuple(map(tuple, self.edges))
+        return (len(self.dfas), edges, tuple(self.labels), self.sink)
+
+    @classmethod
+    def fromTables(cls, tables, alphabet):
+        ndfas, edges, labels, sink = tables
+        ldfa = LDFA([None] * ndfas, list(map(list, edges)), list(labels), alphabet)
+        ldfa.sink = sink
+        ldfa.pack()
+        return ldfa
+
+    @classmethod
+    def fromNFAs(cls, nfas, alphabet):
+
+        tags = dict((nfa.accept, idx + 1) for idx, nfa in enumerate(nfas))
+        idx = 0
+        que = [SimpleNFA.expand([nfa.start for nfa in nfas])]
+        indexMap = {que[0]:0}
+        edges = []
+        labels = []
+
+        while idx < len(que):
+            cur = que[idx]
+            labels.append(max([tags[node] for node in cur if node in tags], default=0))
+            edges.append([])
+            for ch in alphabet.reprs:
+                adj = SimpleNFA.move(cur, ch)
+                if adj not in indexMap:
+                    indexMap[adj] = len(indexMap)
+                    que.append(adj)
+                edges[-1].append(indexMap[adj])
+            idx += 1
+
+        return LDFA([None] * len(nfas), edges, labels, alphabet)
 
     @classmethod
     def fromDFA(cls, dfa):
         dfas = [dfa]
         edges = dfa.edges
         labels = list(map(lambda x: 1 if x in dfa.accepts else 0, range(len(dfa.edges))))
-        charset = dfa.charset
-        return LDFA(dfas, edges, labels, charset)
+        return LDFA(dfas, edges, labels, dfa.alphabet)
 
-def regexToLDFA(regex, charset):
-    return LDFA.fromDFA(DFA.fromNFA(SimpleNFA.fromRegex(regex), charset))
+def regexToLDFA(regex, charset, alphabet=None):
+    nfa = SimpleNFA.fromRegex(regex)
+    alphabet = Alphabet(charset, [nfa]) if alphabet is None else alphabet
+    return LDFA.fromDFA(DFA.fromNFA(nfa, alphabet))
 
 if __name__ == "__main__":
     
@@ -304,9 +718,10 @@ if __name__ == "__main__":
     nfa1 = SimpleNFA.fromRegex(r1)
     nfa2 = SimpleNFA.fromRegex(r2)
     nfa3 = SimpleNFA.fromRegex(r3)
-    dfa1 = DFA.fromNFA(nfa1, chars)
-    dfa2 = DFA.fromNFA(nfa2, chars)
-    dfa3 = DFA.fromNFA(nfa3, chars)
+    alphabet = Alphabet(chars, [nfa1, nfa2, nfa3])
+    dfa1 = DFA.fromNFA(nfa1, alphabet)
+    dfa2 = DFA.fromNFA(nfa2, alphabet)
+    dfa3 = DFA.fromNFA(nfa3, alphabet)
 
     ldfa1 = LDFA.fromDFA(dfa1)
     ldfa2 = LDFA.fromDFA(dfa2)
@@ -319,8 +734,8 @@ if __name__ == "__main__":
 
     while True:
         s = input().strip()
-        ldfa1.init()
+        cur = ldfa1.init()
         for ch in s:
-            ldfa1.shift(ch)
-        print(ldfa1.label())
-        print(ldfa1.sinked())
+            cur = ldfa1.shift(cur, ch)
+        print(ldfa1.label(cur))
+        print(ldfa1.sinked(cur))
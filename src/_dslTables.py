@@ -0,0 +1,2262 @@
+# Generated by bootstrap.py, do not edit.
+# Run `python3 bootstrap.py` after changing the bootstrap grammars or the table format.
+
+VERSION = 'a4a24a8d62ffe1684e13740fe43af4bfbc786b5754a16228c9b649abff0394c7'
+
+TABLES = {'_lexerLexer': ((('::=', '::=', False),
+                  ('%keys', '%keys', False),
+                  ('%ignore', '%ignore', False),
+                  ('comment', '#[^\n]*\n', True),
+                  ('identifier', '[_a-zA-Z][_a-zA-Z0-9]*', True),
+                  ('sqString', "'[^']*'", True),
+                  ('dqString', '"[^"\\]*(\\\\.[^"\\]*)*"', True),
+                  ('reString', '/[^/\\]*(\\\\.[^/\\]*)*/', True)),
+                 False,
+                 ('comment',),
+                 None,
+                 ((0,
+                   10,
+                   11,
+                   34,
+                   35,
+                   36,
+                   37,
+                   38,
+                   39,
+                   40,
+                   47,
+                   48,
+                   58,
+                   59,
+                   61,
+                   62,
+                   65,
+                   91,
+                   92,
+                   93,
+                   95,
+                   96,
+                   97,
+                   101,
+                   102,
+                   103,
+                   104,
+                   105,
+                   106,
+                   107,
+                   108,
+                   110,
+                   111,
+                   112,
+                   114,
+                   115,
+                   116,
+                   121,
+                   122,
+                   123),
+                  (0,
+                   1,
+                   0,
+                   2,
+                   3,
+                   0,
+                   4,
+                   0,
+                   5,
+                   0,
+                   6,
+                   7,
+                   8,
+                   0,
+                   9,
+                   0,
+                   10,
+                   0,
+                   11,
+                   0,
+                   10,
+                   0,
+                   10,
+                   12,
+                   10,
+                   13,
+                   10,
+                   14,
+                   10,
+                   15,
+                   10,
+                   16,
+                   17,
+                   10,
+                   18,
+                   19,
+                   10,
+                   20,
+                   10,
+                   0),
+                  (0, 10, 34, 35, 37, 39, 47, 48, 58, 61, 65, 92, 101, 103, 105, 107, 110, 111, 114, 115, 121)),
+                 (8,
+                  ((1, 1, 2, 3, 4, 5, 6, 1, 7, 1, 8, 1, 8, 8, 8, 8, 8, 8, 8, 8, 8),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                   (2, 2, 9, 2, 2, 2, 2, 2, 2, 2, 2, 10, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+                   (3, 11, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 12, 13, 1, 1, 1, 1, 1),
+                   (5, 5, 5, 5, 5, 14, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5),
+                   (6, 6, 6, 6, 6, 6, 15, 6, 6, 6, 6, 16, 6, 6, 6, 6, 6, 6, 6, 6, 6),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 17, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                   (1, 1, 1, 1, 1, 1, 1, 8, 1, 1, 8, 1, 8, 8, 8, 8, 8, 8, 8, 8, 8),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                   (2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 18, 1, 1, 1, 1, 1, 1, 1),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 19, 1, 1, 1, 1, 1, 1, 1, 1),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                   (6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 1, 20, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 21, 1, 1, 1, 1),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 22),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 23, 1, 1, 1),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 24, 1),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 25, 1, 1),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 26, 1, 1, 1, 1, 1, 1, 1, 1),
+                   (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1)),
+                  (0, 0, 0, 0, 0, 0, 0, 0, 5, 7, 0, 4, 0, 0, 6, 8, 0, 0, 0, 0, 1, 0, 0, 0, 2, 0, 3),
+                  1),
+                 'auto',
+                 None),
+ '_lexerParser': ('EarleyParser',
+                  'LexRules',
+                  (('LexRules', ('rules',)),
+                   ('rules', ()),
+                   ('rules', ('rule', 'rules')),
+                   ('rule', ('identifier', '::=', 'sqString')),
+                   ('rule', ('identifier', '::=', 'dqString')),
+                   ('rule', ('identifier', '::=', 'reString')),
+                   ('rule', ('%keys', '::=', 'keys')),
+                   ('rule', ('%ignore', '::=', 'elements')),
+                   ('keys', ('key',)),
+                   ('keys', ('key', 'keys')),
+                   ('key', ('sqString',)),
+                   ('key', ('dqString',)),
+                   ('elements', ('element',)),
+                   ('elements', ('element', 'elements')),
+                   ('element', ('identifier',)),
+                   ('element', ('sqString',)),
+                   ('element', ('dqString',))),
+                  (('::=',), ('rules', 'keys', 'key', 'element', 'elements'), ())),
+ '_parserLexer': ((('$', '$', False),
+                   ('|', '|', False),
+                   ('(', '(', False),
+                   (')', ')', False),
+                   ('$', '$', False),
+                   ('+', '+', False),
+                   ('*', '*', False),
+                   ('?', '?', False),
+                   ('::=', '::=', False),
+                   ('configType', '%(ignore|expandSingle|expand)', True),
+                   ('identifier', '[_a-zA-Z][_a-zA-Z0-9]*', True),
+                   ('sqString', "'[^']*'", True),
+                   ('dqString', '"[^"\\]*(\\.[^"\\]*)*"', True),
+                   ('comment', '#[^\n]*\n', True)),
+                  False,
+                  ('comment',),
+                  None,
+                  ((0,
+                    10,
+                    11,
+                    34,
+                    35,
+                    36,
+                    37,
+                    38,
+                    39,
+                    40,
+                    41,
+                    42,
+                    43,
+                    44,
+                    46,
+                    47,
+                    48,
+                    58,
+                    59,
+                    61,
+                    62,
+                    63,
+                    64,
+                    65,
+                    83,
+                    84,
+                    91,
+                    92,
+                    93,
+                    95,
+                    96,
+                    97,
+                    98,
+                    100,
+                    101,
+                    102,
+                    103,
+                    104,
+                    105,
+                    106,
+                    108,
+                    109,
+                    110,
+                    111,
+                    112,
+                    113,
+                    114,
+                    115,
+                    120,
+                    121,
+                    123,
+                    124,
+                    125),
+                   (0,
+                    1,
+                    0,
+                    2,
+                    3,
+                    4,
+                    5,
+                    0,
+                    6,
+                    7,
+                    8,
+                    9,
+                    10,
+                    0,
+                    11,
+                    0,
+                    12,
+                    13,
+                    0,
+                    14,
+                    0,
+                    15,
+                    0,
+                    16,
+                    17,
+                    16,
+                    0,
+                    18,
+                    0,
+                    16,
+                    0,
+                    19,
+                    16,
+                    20,
+                    21,
+                    16,
+                    22,
+                    16,
+                    23,
+                    16,
+                    24,
+                    16,
+                    25,
+                    26,
+                    27,
+                    16,
+                    28,
+                    16,
+                    29,
+                    16,
+                    0,
+                    30,
+                    0),
+                   (0,
+                    10,
+                    34,
+                    35,
+                    36,
+                    37,
+                    39,
+                    40,
+                    41,
+                    42,
+                    43,
+                    46,
+                    48,
+                    58,
+                    61,
+                    63,
+                    65,
+                    83,
+                    92,
+                    97,
+                    100,
+                    101,
+                    103,
+                    105,
+                    108,
+                    110,
+                    111,
+                    112,
+                    114,
+                    120,
+                    124)),
+                  (14,
+                   ((1,
+                     1,
+                     2,
+                     3,
+                     4,
+                     5,
+                     6,
+                     7,
+                     8,
+                     9,
+                     10,
+                     1,
+                     1,
+                     11,
+                     1,
+                     12,
+                     13,
+                     13,
+                     1,
+                     13,
+                     13,
+                     13,
+                     13,
+                     13,
+                     13,
+                     13,
+                     13,
+                     13,
+                     13,
+                     13,
+                     14),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (2, 2, 15, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+                    (3, 16, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 17, 1, 18, 1, 1, 1, 1, 1, 1, 1),
+                    (6, 6, 6, 6, 6, 6, 19, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 20, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1,
+                     1,
+                     1,
+                     1,
+                     1,
+                     1,
+                     1,
+                     1,
+                     1,
+                     1,
+                     1,
+                     1,
+                     13,
+                     1,
+                     1,
+                     1,
+                     13,
+                     13,
+                     1,
+                     13,
+                     13,
+                     13,
+                     13,
+                     13,
+                     13,
+                     13,
+                     13,
+                     13,
+                     13,
+                     13,
+                     1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 21, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 22, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 23, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 24, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 25, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 26, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 27, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 28, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 29, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 30, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 31, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 32, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 33, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 34, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 35, 1, 1, 1, 1, 1, 1, 1, 1),
+                    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 29, 1, 1, 1, 1, 1, 1)),
+                   (0,
+                    0,
+                    0,
+                    0,
+                    5,
+                    0,
+                    0,
+                    3,
+                    4,
+                    7,
+                    6,
+                    0,
+                    8,
+                    11,
+                    2,
+                    13,
+                    14,
+                    0,
+                    0,
+                    12,
+                    0,
+                    0,
+                    0,
+                    9,
+                    0,
+                    0,
+                    0,
+                    0,
+                    0,
+                    0,
+                    10,
+                    10,
+                    0,
+                    0,
+                    0,
+                    0),
+                   1),
+                  'auto',
+                  None),
+ '_parserParser': ('EarleyParser',
+                   'ParseRules',
+                   (('ParseRules', ('rules',)),
+                    ('rules', ()),
+                    ('rules', ('rule', 'rules')),
+                    ('rule', ('identifier', '::=', 'alternates')),
+                    ('rule', ('configType', '::=', 'simpleItems')),
+                    ('alternates', ('alternate',)),
+                    ('alternates', ('alternate', '|', 'alternates')),
+                    ('alternate', ('$',)),
+                    ('alternate', ('rhsItems',)),
+                    ('rhsItems', ('rhsItem',)),
+                    ('rhsItems', ('rhsItem', 'rhsItems')),
+                    ('rhsItem', ('itemValue', 'decorator')),
+                    ('itemValue', ('simpleItem',)),
+                    ('itemValue', ('(', 'alternates', ')')),
+                    ('decorator', ()),
+                    ('decorator', ('?',)),
+                    ('decorator', ('+',)),
+                    ('decorator', ('*',)),
+                    ('simpleItems', ('simpleItem',)),
+                    ('simpleItems', ('simpleItem', 'simpleItems')),
+                    ('simpleItem', ('identifier',)),
+                    ('simpleItem', ('dqString',)),
+                    ('simpleItem', ('sqString',))),
+                   (('::=', '|', '$', '(', ')'),
+                    ('rules', 'rhsItems', 'alternates', 'decorator', 'simpleItem', 'simpleItems'),
+                    ())),
+ '_dslLexer': ((('identifier', '[_a-zA-Z][_a-zA-Z0-9]*', True),
+                ('sqString', "'[^']*'", True),
+                ('dqString', '"[^"\\]*(\\\\.[^"\\]*)*"', True),
+                ('reString', '/[^/\\]*(\\\\.[^/\\]*)*/', True),
+                ('configType', '%(ignore|expandSingle|expand)', True),
+                ('comment', '#[^\n]*\n', True),
+                ('$', '$', False),
+                ('|', '|', False),
+                ('::=', '::=', False),
+                ('(', '(', False),
+                (')', ')', False),
+                ('*', '*', False),
+                ('+', '+', False),
+                ('?', '?', False)),
+               False,
+               ('comment',),
+               None,
+               ((0,
+                 10,
+                 11,
+                 34,
+                 35,
+                 36,
+                 37,
+                 38,
+                 39,
+                 40,
+                 41,
+                 42,
+                 43,
+                 44,
+                 47,
+                 48,
+                 58,
+                 59,
+                 61,
+                 62,
+                 63,
+                 64,
+                 65,
+                 83,
+                 84,
+                 91,
+                 92,
+                 93,
+                 95,
+                 96,
+                 97,
+                 98,
+                 100,
+                 101,
+                 102,
+                 103,
+                 104,
+                 105,
+                 106,
+                 108,
+                 109,
+                 110,
+                 111,
+                 112,
+                 113,
+                 114,
+                 115,
+                 120,
+                 121,
+                 123,
+                 124,
+                 125),
+                (0,
+                 1,
+                 0,
+                 2,
+                 3,
+                 4,
+                 5,
+                 0,
+                 6,
+                 7,
+                 8,
+                 9,
+                 10,
+                 0,
+                 11,
+                 12,
+                 13,
+                 0,
+                 14,
+                 0,
+                 15,
+                 0,
+                 16,
+                 17,
+                 16,
+                 0,
+                 18,
+                 0,
+                 16,
+                 0,
+                 19,
+                 16,
+                 20,
+                 21,
+                 16,
+                 22,
+                 16,
+                 23,
+                 16,
+                 24,
+                 16,
+                 25,
+                 26,
+                 27,
+                 16,
+                 28,
+                 16,
+                 29,
+                 16,
+                 0,
+                 30,
+                 0),
+                (0,
+                 10,
+                 34,
+                 35,
+                 36,
+                 37,
+                 39,
+                 40,
+                 41,
+                 42,
+                 43,
+                 47,
+                 48,
+                 58,
+                 61,
+                 63,
+                 65,
+                 83,
+                 92,
+                 97,
+                 100,
+                 101,
+                 103,
+                 105,
+                 108,
+                 110,
+                 111,
+                 112,
+                 114,
+                 120,
+                 124)),
+               (14,
+                ((1,
+                  1,
+                  2,
+                  3,
+                  4,
+                  5,
+                  6,
+                  7,
+                  8,
+                  9,
+                  10,
+                  11,
+                  1,
+                  12,
+                  1,
+                  13,
+                  14,
+                  14,
+                  1,
+                  14,
+                  14,
+                  14,
+                  14,
+                  14,
+                  14,
+                  14,
+                  14,
+                  14,
+                  14,
+                  14,
+                  15),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (2, 2, 16, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 17, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+                 (3, 18, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 19, 1, 20, 1, 1, 1, 1, 1, 1, 1),
+                 (6, 6, 6, 6, 6, 6, 21, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  22,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  23,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 24, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (1,
+                  1,
+                  1,
+                  1,
+                  1,
+                  1,
+                  1,
+                  1,
+                  1,
+                  1,
+                  1,
+                  1,
+                  14,
+                  1,
+                  1,
+                  1,
+                  14,
+                  14,
+                  1,
+                  14,
+                  14,
+                  14,
+                  14,
+                  14,
+                  14,
+                  14,
+                  14,
+                  14,
+                  14,
+                  14,
+                  1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 25, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 26, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11,
+                  11),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 27, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 28, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 29, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 30, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 31, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 32, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 33, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 34, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 35, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 36, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 37, 1, 1, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 38, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 39, 1, 1, 1, 1, 1, 1, 1, 1),
+                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 33, 1, 1, 1, 1, 1, 1)),
+                (0,
+                 0,
+                 0,
+                 0,
+                 7,
+                 0,
+                 0,
+                 10,
+                 11,
+                 12,
+                 13,
+                 0,
+                 0,
+                 14,
+                 1,
+                 8,
+                 3,
+                 0,
+                 6,
+                 0,
+                 0,
+                 2,
+                 4,
+                 0,
+                 0,
+                 0,
+                 0,
+                 9,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 5,
+                 5,
+                 0,
+                 0,
+                 0,
+                 0),
+                1),
+               'auto',
+               None),
+ '_dslParser': ('GLRParser',
+                'DSLRules',
+                (('_parser_0', ()),
+                 ('_parser_0', ('rule', '_parser_0')),
+                 ('DSLRules', ('_parser_0',)),
+                 ('rule', ('identifier', '::=', 'reString')),
+                 ('_parser_1', ('|', 'alternate')),
+                 ('_parser_2', ()),
+                 ('_parser_2', ('_parser_1', '_parser_2')),
+                 ('rule', ('identifier', '::=', 'alternate', '_parser_2')),
+                 ('_parser_3', ('simpleItem', '_parser_3')),
+                 ('_parser_3', ('simpleItem',)),
+                 ('rule', ('configType', '::=', '_parser_3')),
+                 ('alternate', ('$',)),
+                 ('_parser_4', ('rhsItem', '_parser_4')),
+                 ('_parser_4', ('rhsItem',)),
+                 ('alternate', ('_parser_4',)),
+                 ('_parser_5', ('?',)),
+                 ('_parser_5', ('+',)),
+                 ('_parser_5', ('*',)),
+                 ('_parser_6', ()),
+                 ('_parser_6', ('_parser_5',)),
+                 ('rhsItem', ('itemValue', '_parser_6')),
+                 ('itemValue', ('simpleItem',)),
+                 ('_parser_7', ('|', 'alternate')),
+                 ('_parser_8', ()),
+                 ('_parser_8', ('_parser_7', '_parser_8')),
+                 ('itemValue', ('(', 'alternate', '_parser_8', ')')),
+                 ('simpleItem', ('identifier',)),
+                 ('simpleItem', ('dqString',)),
+                 ('simpleItem', ('sqString',))),
+                (('::=', '|', '$', '(', ')'),
+                 ('simpleItem',
+                  '_parser_0',
+                  '_parser_1',
+                  '_parser_2',
+                  '_parser_3',
+                  '_parser_4',
+                  '_parser_5',
+                  '_parser_6',
+                  '_parser_7',
+                  '_parser_8'),
+                 ()),
+                (None,
+                 'identifier',
+                 '::=',
+                 'reString',
+                 '|',
+                 'configType',
+                 '$',
+                 '?',
+                 '+',
+                 '*',
+                 '(',
+                 ')',
+                 'dqString',
+                 'sqString',
+                 'DSLRules',
+                 '_parser_0',
+                 'rule',
+                 'alternate',
+                 '_parser_4',
+                 'rhsItem',
+                 'itemValue',
+                 'simpleItem',
+                 '_parser_3',
+                 '_parser_2',
+                 '_parser_1',
+                 '_parser_6',
+                 '_parser_5',
+                 '_parser_8',
+                 '_parser_7'),
+                (369,
+                 2,
+                 3,
+                 16,
+                 4,
+                 9,
+                 22,
+                 17,
+                 157,
+                 14,
+                 386,
+                 74,
+                 76,
+                 39,
+                 0,
+                 83,
+                 88,
+                 110,
+                 124,
+                 138,
+                 166,
+                 41,
+                 203,
+                 501,
+                 515,
+                 610,
+                 411,
+                 143,
+                 205,
+                 299,
+                 313,
+                 327,
+                 341,
+                 355,
+                 525,
+                 44,
+                 93,
+                 164,
+                 60,
+                 233,
+                 180,
+                 246,
+                 259,
+                 272,
+                 616,
+                 622,
+                 554,
+                 13,
+                 556,
+                 201,
+                 148,
+                 435,
+                 448,
+                 461,
+                 474,
+                 487,
+                 581,
+                 223,
+                 17,
+                 169,
+                 22,
+                 285),
+                (-20,
+                 -20,
+                 -1,
+                 -4,
+                 -20,
+                 -20,
+                 7,
+                 31,
+                 32,
+                 33,
+                 -20,
+                 8,
+                 -20,
+                 -20,
+                 -5,
+                 -5,
+                 -2,
+                 4,
+                 17,
+                 -5,
+                 9,
+                 5,
+                 -3,
+                 11,
+                 57,
+                 29,
+                 30,
+                 16,
+                 -26,
+                 18,
+                 19,
+                 6,
+                 3,
+                 61,
+                 10,
+                 12,
+                 13,
+                 14,
+                 15,
+                 -15,
+                 62,
+                 -11,
+                 63,
+                 -15,
+                 -15,
+                 0,
+                 -11,
+                 0,
+                 -13,
+                 16,
+                 0,
+                 18,
+                 19,
+                 23,
+                 24,
+                 -13,
+                 0,
+                 28,
+                 13,
+                 14,
+                 15,
+                 -20,
+                 21,
+                 44,
+                 -20,
+                 0,
+                 0,
+                 53,
+                 54,
+                 55,
+                 -20,
+                 -20,
+                 -20,
+                 -20,
+                 -13,
+                 -13,
+                 -16,
+                 -16,
+                 -13,
+                 -13,
+                 -16,
+                 -16,
+                 0,
+                 -23,
+                 -23,
+                 51,
+                 52,
+                 -23,
+                 -23,
+                 41,
+                 -23,
+                 -23,
+                 -23,
+                 -23,
+                 35,
+                 -23,
+                 -23,
+                 -16,
+                 40,
+                 0,
+                 42,
+                 43,
+                 0,
+                 0,
+                 -16,
+                 34,
+                 36,
+                 37,
+                 38,
+                 39,
+                 -28,
+                 -28,
+                 0,
+                 0,
+                 -28,
+                 -28,
+                 0,
+                 -28,
+                 -28,
+                 -28,
+                 -28,
+                 0,
+                 -28,
+                 -28,
+                 -29,
+                 -29,
+                 0,
+                 0,
+                 -29,
+                 -29,
+                 0,
+                 -29,
+                 -29,
+                 -29,
+                 -29,
+                 0,
+                 -29,
+                 -29,
+                 -30,
+                 -30,
+                 0,
+                 0,
+                 -30,
+                 -30,
+                 17,
+                 -30,
+                 -30,
+                 -30,
+                 -30,
+                 11,
+                 -30,
+                 -30,
+                 -14,
+                 16,
+                 0,
+                 18,
+                 19,
+                 0,
+                 22,
+                 -14,
+                 46,
+                 12,
+                 13,
+                 14,
+                 15,
+                 41,
+                 -12,
+                 -12,
+                 -15,
+                 23,
+                 24,
+                 -12,
+                 0,
+                 -24,
+                 40,
+                 -15,
+                 42,
+                 43,
+                 21,
+                 20,
+                 -24,
+                 41,
+                 50,
+                 37,
+                 38,
+                 39,
+                 35,
+                 0,
+                 0,
+                 0,
+                 40,
+                 0,
+                 42,
+                 43,
+                 0,
+                 0,
+                 0,
+                 56,
+                 36,
+                 37,
+                 38,
+                 39,
+                 41,
+                 -28,
+                 -28,
+                 -14,
+                 -14,
+                 35,
+                 -28,
+                 -14,
+                 -14,
+                 40,
+                 0,
+                 42,
+                 43,
+                 -28,
+                 -28,
+                 0,
+                 59,
+                 36,
+                 37,
+                 38,
+                 39,
+                 -27,
+                 -27,
+                 0,
+                 0,
+                 -27,
+                 -27,
+                 0,
+                 -27,
+                 -27,
+                 -27,
+                 -27,
+                 -23,
+                 -27,
+                 -27,
+                 -23,
+                 0,
+                 0,
+                 -23,
+                 -23,
+                 -23,
+                 -23,
+                 -23,
+                 -23,
+                 -23,
+                 -28,
+                 0,
+                 0,
+                 -28,
+                 0,
+                 0,
+                 -28,
+                 -28,
+                 -28,
+                 -28,
+                 -28,
+                 -28,
+                 -28,
+                 -29,
+                 0,
+                 0,
+                 -29,
+                 0,
+                 0,
+                 -29,
+                 -29,
+                 -29,
+                 -29,
+                 -29,
+                 -29,
+                 -29,
+                 -30,
+                 0,
+                 0,
+                 -30,
+                 0,
+                 0,
+                 -30,
+                 -30,
+                 -30,
+                 -30,
+                 -30,
+                 -30,
+                 -30,
+                 -27,
+                 0,
+                 0,
+                 -27,
+                 0,
+                 0,
+                 -27,
+                 -27,
+                 -27,
+                 -27,
+                 -27,
+                 -27,
+                 -27,
+                 -22,
+                 -22,
+                 0,
+                 0,
+                 -22,
+                 -22,
+                 0,
+                 0,
+                 0,
+                 0,
+                 -22,
+                 0,
+                 -22,
+                 -22,
+                 -21,
+                 -21,
+                 0,
+                 0,
+                 -21,
+                 -21,
+                 0,
+                 0,
+                 0,
+                 0,
+                 -21,
+                 0,
+                 -21,
+                 -21,
+                 -17,
+                 -17,
+                 0,
+                 0,
+                 -17,
+                 -17,
+                 0,
+                 0,
+                 0,
+                 0,
+                 -17,
+                 0,
+                 -17,
+                 -17,
+                 -18,
+                 -18,
+                 0,
+                 0,
+                 -18,
+                 -18,
+                 0,
+                 0,
+                 0,
+                 0,
+                 -18,
+                 0,
+                 -18,
+                 -18,
+                 -19,
+                 -19,
+                 0,
+                 0,
+                 -19,
+                 -19,
+                 0,
+                 0,
+                 0,
+                 0,
+                 -19,
+                 0,
+                 -19,
+                 -19,
+                 -2,
+                 4,
+                 0,
+                 0,
+                 0,
+                 5,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 1,
+                 2,
+                 3,
+                 -7,
+                 -7,
+                 0,
+                 0,
+                 27,
+                 -7,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 25,
+                 26,
+                 -7,
+                 -7,
+                 0,
+                 0,
+                 27,
+                 -7,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 45,
+                 26,
+                 -22,
+                 0,
+                 0,
+                 -22,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 -22,
+                 -22,
+                 -22,
+                 -22,
+                 -21,
+                 0,
+                 0,
+                 -21,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 -21,
+                 -21,
+                 -21,
+                 -21,
+                 -17,
+                 0,
+                 0,
+                 -17,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 -17,
+                 -17,
+                 -17,
+                 -17,
+                 -18,
+                 0,
+                 0,
+                 -18,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 -18,
+                 -18,
+                 -18,
+                 -18,
+                 -19,
+                 0,
+                 0,
+                 -19,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 -19,
+                 -19,
+                 -19,
+                 -19,
+                 -29,
+                 -29,
+                 0,
+                 0,
+                 0,
+                 -29,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 -29,
+                 -29,
+                 -30,
+                 -30,
+                 0,
+                 0,
+                 0,
+                 -30,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 -30,
+                 -30,
+                 49,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 -25,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 47,
+                 48,
+                 -6,
+                 -6,
+                 0,
+                 0,
+                 -6,
+                 -6,
+                 49,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 -25,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 58,
+                 48,
+                 49,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 -25,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 60,
+                 48,
+                 -9,
+                 -9,
+                 0,
+                 0,
+                 0,
+                 -9,
+                 -10,
+                 -10,
+                 0,
+                 0,
+                 0,
+                 -10,
+                 -8,
+                 -8,
+                 0,
+                 0,
+                 0,
+                 -8,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0,
+                 0),
+                (14,
+                 14,
+                 1,
+                 2,
+                 14,
+                 14,
+                 4,
+                 14,
+                 14,
+                 14,
+                 14,
+                 5,
+                 14,
+                 14,
+                 9,
+                 9,
+                 3,
+                 3,
+                 7,
+                 9,
+                 7,
+                 3,
+                 6,
+                 7,
+                 47,
+                 14,
+                 14,
+                 7,
+                 58,
+                 7,
+                 7,
+                 3,
+                 3,
+                 60,
+                 7,
+                 7,
+                 7,
+                 7,
+                 7,
+                 13,
+                 13,
+                 21,
+                 21,
+                 13,
+                 13,
+                 -1,
+                 21,
+                 -1,
+                 35,
+                 13,
+                 -1,
+                 13,
+                 13,
+                 21,
+                 21,
+                 35,
+                 -1,
+                 13,
+                 13,
+                 13,
+                 13,
+                 38,
+                 21,
+                 21,
+                 38,
+                 -1,
+                 -1,
+                 38,
+                 38,
+                 38,
+                 38,
+                 38,
+                 38,
+                 38,
+                 11,
+                 11,
+                 12,
+                 12,
+                 11,
+                 11,
+                 12,
+                 12,
+                 -1,
+                 15,
+                 15,
+                 38,
+                 38,
+                 15,
+                 15,
+                 16,
+                 15,
+                 15,
+                 15,
+                 15,
+                 16,
+                 15,
+                 15,
+                 36,
+                 16,
+                 -1,
+                 16,
+                 16,
+                 -1,
+                 -1,
+                 36,
+                 16,
+                 16,
+                 16,
+                 16,
+                 16,
+                 17,
+                 17,
+                 -1,
+                 -1,
+                 17,
+                 17,
+                 -1,
+                 17,
+                 17,
+                 17,
+                 17,
+                 -1,
+                 17,
+                 17,
+                 18,
+                 18,
+                 -1,
+                 -1,
+                 18,
+                 18,
+                 -1,
+                 18,
+                 18,
+                 18,
+                 18,
+                 -1,
+                 18,
+                 18,
+                 19,
+                 19,
+                 -1,
+                 -1,
+                 19,
+                 19,
+                 27,
+                 19,
+                 19,
+                 19,
+                 19,
+                 27,
+                 19,
+                 19,
+                 50,
+                 27,
+                 -1,
+                 27,
+                 27,
+                 -1,
+                 8,
+                 50,
+                 27,
+                 27,
+                 27,
+                 27,
+                 27,
+                 37,
+                 20,
+                 20,
+                 37,
+                 8,
+                 8,
+                 20,
+                 -1,
+                 59,
+                 37,
+                 37,
+                 37,
+                 37,
+                 8,
+                 8,
+                 59,
+                 40,
+                 37,
+                 37,
+                 37,
+                 37,
+                 40,
+                 -1,
+                 -1,
+                 -1,
+                 40,
+                 -1,
+                 40,
+                 40,
+                 -1,
+                 -1,
+                 -1,
+                 40,
+                 40,
+                 40,
+                 40,
+                 40,
+                 49,
+                 22,
+                 22,
+                 28,
+                 28,
+                 49,
+                 22,
+                 28,
+                 28,
+                 49,
+                 -1,
+                 49,
+                 49,
+                 22,
+                 22,
+                 -1,
+                 49,
+                 49,
+                 49,
+                 49,
+                 49,
+                 57,
+                 57,
+                 -1,
+                 -1,
+                 57,
+                 57,
+                 -1,
+                 57,
+                 57,
+                 57,
+                 57,
+                 39,
+                 57,
+                 57,
+                 39,
+                 -1,
+                 -1,
+                 39,
+                 39,
+                 39,
+                 39,
+                 39,
+                 39,
+                 39,
+                 41,
+                 -1,
+                 -1,
+                 41,
+                 -1,
+                 -1,
+                 41,
+                 41,
+                 41,
+                 41,
+                 41,
+                 41,
+                 41,
+                 42,
+                 -1,
+                 -1,
+                 42,
+                 -1,
+                 -1,
+                 42,
+                 42,
+                 42,
+                 42,
+                 42,
+                 42,
+                 42,
+                 43,
+                 -1,
+                 -1,
+                 43,
+                 -1,
+                 -1,
+                 43,
+                 43,
+                 43,
+                 43,
+                 43,
+                 43,
+                 43,
+                 61,
+                 -1,
+                 -1,
+                 61,
+                 -1,
+                 -1,
+                 61,
+                 61,
+                 61,
+                 61,
+                 61,
+                 61,
+                 61,
+                 29,
+                 29,
+                 -1,
+                 -1,
+                 29,
+                 29,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 29,
+                 -1,
+                 29,
+                 29,
+                 30,
+                 30,
+                 -1,
+                 -1,
+                 30,
+                 30,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 30,
+                 -1,
+                 30,
+                 30,
+                 31,
+                 31,
+                 -1,
+                 -1,
+                 31,
+                 31,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 31,
+                 -1,
+                 31,
+                 31,
+                 32,
+                 32,
+                 -1,
+                 -1,
+                 32,
+                 32,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 32,
+                 -1,
+                 32,
+                 32,
+                 33,
+                 33,
+                 -1,
+                 -1,
+                 33,
+                 33,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 33,
+                 -1,
+                 33,
+                 33,
+                 0,
+                 0,
+                 -1,
+                 -1,
+                 -1,
+                 0,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 0,
+                 0,
+                 0,
+                 10,
+                 10,
+                 -1,
+                 -1,
+                 10,
+                 10,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 10,
+                 10,
+                 26,
+                 26,
+                 -1,
+                 -1,
+                 26,
+                 26,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 26,
+                 26,
+                 51,
+                 -1,
+                 -1,
+                 51,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 51,
+                 51,
+                 51,
+                 51,
+                 52,
+                 -1,
+                 -1,
+                 52,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 52,
+                 52,
+                 52,
+                 52,
+                 53,
+                 -1,
+                 -1,
+                 53,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 53,
+                 53,
+                 53,
+                 53,
+                 54,
+                 -1,
+                 -1,
+                 54,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 54,
+                 54,
+                 54,
+                 54,
+                 55,
+                 -1,
+                 -1,
+                 55,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 55,
+                 55,
+                 55,
+                 55,
+                 23,
+                 23,
+                 -1,
+                 -1,
+                 -1,
+                 23,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 23,
+                 23,
+                 24,
+                 24,
+                 -1,
+                 -1,
+                 -1,
+                 24,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 24,
+                 24,
+                 34,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 34,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 34,
+                 34,
+                 46,
+                 46,
+                 -1,
+                 -1,
+                 46,
+                 46,
+                 48,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 48,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 48,
+                 48,
+                 56,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 56,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 56,
+                 56,
+                 25,
+                 25,
+                 -1,
+                 -1,
+                 -1,
+                 25,
+                 44,
+                 44,
+                 -1,
+                 -1,
+                 -1,
+                 44,
+                 45,
+                 45,
+                 -1,
+                 -1,
+                 -1,
+                 45,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1,
+                 -1),
+                ((17, -15), (22, -11)))}
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+
+import collections
+import concurrent.futures
+import marshal
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+
+import DSL
+import Lexer
+import Parser
+import Regex
+
+LIST_CONFIG = r"""#dsl
+    number ::= /[0-9]+/
+    items ::= number*
+"""
+
+JSON_CONFIG = r"""#dsl
+    string ::= /"[^"\\]*(\\\\.[^"\\]*)*"/
+    number ::= /[0-9]+(\\.[0-9])?/
+    object ::= '{' (kvPair (',' kvPair)*)? '}'
+    kvPair ::= string ':' value
+    array ::= '[' (value (',' value)*)? ']'
+    value ::= string | number | object | array | 'true' | 'false' | 'null'
+    %ignore ::= '{' '}' '[' ']' ',' ':'
+    %expand ::= value
+"""
+
+CALCULATOR_CONFIG = r"""#dsl
+    identifier ::= /[_a-zA-Z][_a-zA-Z0-9]*/
+    number ::= /[0-9]+(\\.[0-9]+)?/
+    operator ::= /[+*\/-]/
+    expression ::= operand (operator operand)*
+    operand ::= identifier | number
+    %expand ::= operand
+"""
+
+def calculatorData(count, seed=1117):
+    rand = random.Random(seed)
+    operands = [rand.choice(["x", "total", "rate_2", "42", "3.14159", "1000"]) for idx in range(count)]
+    return operands[0] + "".join(" {0} {1}".format(rand.choice("+-*/"), operand) for operand in operands[1:])
+
+def jsonData(count, seed=1117):
+    rand = random.Random(seed)
+    items = []
+    for idx in range(count):
+        items.append('{{"id": {0}, "name": "item \\"{1}\\"", "tags": ["a", "b", "c"], "score": {2}.5, "ok": {3}, "next": null}}'.format(
+            idx, rand.randint(0, 1 << 20), rand.randint(0, 100), rand.choice(["true", "false"])))
+    return '{"items": [\n' + ",\n".join(items) + "\n]}"
+
+def keywords(count, minLen=2, maxLen=10, seed=1117):
+    rand = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        words.add("".join(rand.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rand.randint(minLen, maxLen))))
+    return sorted(words)
+
+def keywordRules(count, minLen=2, maxLen=10):
+    return [
+        Lexer.Rule("identifier", "[_a-zA-Z][_a-zA-Z0-9]*"),
+        Lexer.Rule("number", "[0-9]+(\\.[0-9]+)?"),
+        Lexer.Rule("dqString", "\"[^\"\\]*(\\\\.[^\"\\]*)*\""),
+        Lexer.Rule("comment", "/\\*[^*]*(\\*+[^*/][^*]*)*\\*+/"),
+    ] + [Lexer.Rule(word, word, isRegex=False) for word in keywords(count, minLen, maxLen)]
+
+def grammarRules(count):
+    levels = count // 4
+    rules = [Parser.Rule("program", []), Parser.Rule("program", ["stmt", "program"])]
+    for idx in range(levels):
+        rules.append(Parser.Rule("expr{0}".format(idx), ["expr{0}".format(idx), "op{0}".format(idx), "expr{0}".format(idx + 1)]))
+        rules.append(Parser.Rule("expr{0}".format(idx), ["expr{0}".format(idx + 1)]))
+    rules.append(Parser.Rule("expr{0}".format(levels), ["identifier"]))
+    rules.append(Parser.Rule("expr{0}".format(levels), ["(", "expr0", ")"]))
+    for idx in range(count - len(rules)):
+        rules.append(Parser.Rule("stmt", ["kw{0}".format(idx), "expr0", "block" if idx % 2 else ";"]))
+    rules.append(Parser.Rule("block", ["{", "program", "}"]))
+    return rules
+
+def grammarTokens(rules, count, seed=1117):
+    rand = random.Random(seed)
+    stmts = [rule for rule in rules if rule.lhs == "stmt"]
+    tokens = []
+    for _ in range(count):
+        rule = rand.choice(stmts)
+        names = [rule.rhs[0], "identifier", "op0", "identifier"] + (["{", "}"] if rule.rhs[2] == "block" else [";"])
+        tokens.extend(Lexer.Token(name, name) for name in names)
+    return tokens
+
+def timed(func, repeat=1):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ret = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return ret, best
+
+def mergedLDFA(lexer):
+    ldfa = None
+    for rule in lexer.rules:
+        nfa = Regex.SimpleNFA.fromRegex(rule.value if rule.isRegex else "\\" + "\\".join(rule.value))
+        _ldfa = Regex.LDFA.fromDFA(Regex.DFA.fromNFA(nfa, lexer.alphabet))
+        if ldfa is None:
+            ldfa = _ldfa
+        else:
+            ldfa.merge(_ldfa)
+    return ldfa
+
+def canonical(ldfa):
+    que = [0]
+    indexMap = {0: 0}
+    for cur in que:
+        for adj in ldfa.edges[cur]:
+            if adj not in indexMap:
+                indexMap[adj] = len(indexMap)
+                que.append(adj)
+    return [(ldfa.labels[cur], [indexMap[adj] for adj in ldfa.edges[cur]]) for cur in que]
+
+def benchMinimize():
+    print("{0:>9} {1:>9} {2:>9} {3:>9} {4:>12}".format("keywords", "length", "states", "minimal", "minimize(s)"))
+    for count, minLen, maxLen in [(10, 2, 10), (50, 2, 10), (200, 2, 10), (10, 40, 80), (50, 40, 80), (200, 40, 80)]:
+        ldfa = mergedLDFA(Lexer.Lexer(keywordRules(count, minLen, maxLen)))
+        states = len(ldfa.edges)
+        _, elapsed = timed(ldfa.minimize)
+        length = "{0}-{1}".format(minLen, maxLen)
+        print("{0:>9} {1:>9} {2:>9} {3:>9} {4:>12.4f}".format(count, length, states, len(ldfa.edges), elapsed))
+
+def methodCallParse(lexer, string):
+    idx = 0
+    tokens = []
+    while idx < len(string):
+        nidx = idx
+        cut = None
+        cur = lexer.ldfa.init()
+        while nidx < len(string) and not lexer.ldfa.sinked(cur):
+            cur = lexer.ldfa.shift(cur, string[nidx])
+            if lexer.ldfa.label(cur) > 0:
+                cut = (nidx+1, lexer.ldfa.label(cur)-1)
+            nidx += 1
+        if cut:
+            if lexer.rules[cut[1]].name not in lexer.ignore:
+                tokens.append(Lexer.Token(lexer.rules[cut[1]].name, string[idx:cut[0]]))
+            idx = cut[0]
+        elif string[idx].isspace():
+            idx += 1
+        else:
+            raise RuntimeError("Can't parse string")
+    return tokens
+
+def benchLex():
+    lexer = DSL.makeDSL(JSON_CONFIG).lexer
+    data = jsonData(20000)
+    print("{0} chars".format(len(data)))
+    dfaLexer = Lexer.Lexer(lexer.rules, ignore=lexer.ignore, backend="dfa")
+    reLexer = Lexer.Lexer(lexer.rules, ignore=lexer.ignore, backend="re")
+    for name, parse in [("method calls", lambda: methodCallParse(lexer, data)), ("dfa", lambda: dfaLexer.parse(data)), ("re", lambda: reLexer.parse(data))]:
+        tokens, elapsed = timed(parse, 3)
+        print("{0:>14}: {1} tokens in {2:.3f}s, {3:.0f} tokens/s".format(name, len(tokens), elapsed, len(tokens) / elapsed))
+
+def benchCodegen():
+    rand = random.Random(1)
+    longData = " ".join("".join(rand.choice("abcdefghij") for _ in range(rand.randint(20, 60))) + ' "' + "x" * rand.randint(20, 80) + '"' for _ in range(20000))
+    longConfig = """#dsl
+    word ::= /[a-j]+/
+    string ::= /"[^"]*"/
+"""
+    for name, config, data in [("calculator", CALCULATOR_CONFIG, calculatorData(200000)), ("json", JSON_CONFIG, jsonData(20000)), ("long tokens", longConfig, longData)]:
+        lexer = DSL.makeDSL(config).lexer
+        print("{0}: {1} chars, {2} states".format(name, len(data), len(lexer.ldfa.edges)))
+        for backend in ["dfa", "code"]:
+            _lexer, build = timed(lambda: Lexer.Lexer(lexer.rules, ignore=lexer.ignore, backend=backend))
+            _, scanned = timed(lambda: collections.deque(_lexer.scanString(data), 0), 3)
+            tokens, elapsed = timed(lambda: _lexer.parse(data), 3)
+            print("{0:>14}: {1} tokens, scan {2:.0f} tokens/s, parse {3:.0f} tokens/s, built in {4:.3f}s".format(backend, len(tokens), len(tokens) / scanned, len(tokens) / elapsed, build))
+
+def benchTokenMemory():
+    lexer = DSL.makeDSL(JSON_CONFIG).lexer
+    data = jsonData(20000)
+    for name, parse in [("list of Token", lexer.parse), ("TokenArray", lexer.parseTokenArray)]:
+        tracemalloc.start()
+        tokens = parse(data)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print("{0:>14}: {1} tokens, {2:.1f} bytes/token".format(name, len(tokens), size / len(tokens)))
+        del tokens
+
+def benchLexerBuild():
+    print("{0:>9} {1:>14} {2:>14} {3:>9}".format("keywords", "merge(s)", "union(s)", "states"))
+    for count in [50, 200, 1000]:
+        rules = keywordRules(count)
+        lexer, union = timed(lambda: Lexer.Lexer(rules))
+        if count <= 200:
+            def merged():
+                ldfa = mergedLDFA(lexer)
+                ldfa.minimize()
+                return ldfa
+            ldfa, merge = timed(merged)
+            assert(canonical(ldfa) == canonical(lexer.ldfa))
+            merge = "{0:.3f}".format(merge)
+        else:
+            merge = "-"
+        print("{0:>9} {1:>14} {2:>14.3f} {3:>9}".format(count, merge, union, len(lexer.ldfa.edges)))
+
+def benchParserBuild():
+    print("{0:>12} {1:>9} {2:>9} {3:>9} {4:>9}".format("grammar", "lalr", "lalr(s)", "lr1", "lr1(s)"))
+    for name, config in [("calculator", CALCULATOR_CONFIG), ("json", JSON_CONFIG)]:
+        lalr, lalrTime = timed(lambda: DSL.makeDSL(config, cache=False, algorithm="lalr").parser)
+        lr1, lr1Time = timed(lambda: DSL.makeDSL(config, cache=False, algorithm="lr1").parser)
+        print("{0:>12} {1:>9} {2:>9.4f} {3:>9} {4:>9.4f}".format(name, lalr.states, lalrTime, lr1.states, lr1Time))
+
+def benchGrammarBuild():
+    print("{0:>12} {1:>9} {2:>9} {3:>9} {4:>9}".format("productions", "lalr", "lalr(s)", "lr1", "lr1(s)"))
+    for count in [100, 300, 1000]:
+        rules = grammarRules(count)
+        lalr, lalrTime = timed(lambda: Parser.LALRParser("program", rules))
+        lr1, lr1Time = timed(lambda: Parser.LR1Parser("program", rules))
+        print("{0:>12} {1:>9} {2:>9.3f} {3:>9} {4:>9.3f}".format(len(rules), lalr.states, lalrTime, lr1.states, lr1Time))
+
+def benchParse():
+    dsl = DSL.makeDSL(JSON_CONFIG)
+    tables = marshal.dumps(dsl.parser.toTables())
+    tracemalloc.start()
+    parser = Parser.Parser.fromTables(marshal.loads(tables))
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    states = parser.states
+    print("{0}: {1} states, {2:.0f} bytes/state".format(parser.__class__.__name__, states, size / states))
+    data = jsonData(400)
+    for name, tokens in [("list of Token", dsl.lexer.parse(data)), ("TokenArray", dsl.lexer.parseTokenArray(data))]:
+        _, elapsed = timed(lambda: parser.parse(tokens), 10)
+        print("{0:>14}: {1} tokens in {2:.3f}s, {3:.0f} tokens/s".format(name, len(tokens), elapsed, len(tokens) / elapsed))
+
+def benchLongList():
+    print("{0:>9} {1:>9} {2:>9} {3:>12}".format("algorithm", "items", "parse(s)", "us/item"))
+    for algorithm, counts in [("lalr", [20000, 40000, 80000, 160000]), ("glr", [20000, 40000, 80000]), ("earley", [10000, 20000, 40000])]:
+        dsl = DSL.makeDSL(LIST_CONFIG, algorithm=algorithm)
+        for count in counts:
+            data = "1 " * count
+            _, elapsed = timed(lambda: dsl.parse(data), 3)
+            print("{0:>9} {1:>9} {2:>9.3f} {3:>12.2f}".format(algorithm, count, elapsed, elapsed * 1e6 / count))
+
+def benchEarley():
+    print("{0:>12} {1:>9} {2:>9} {3:>12}".format("grammar", "tokens", "parse(s)", "peak(bytes)"))
+    for name, config, data in [("calculator", CALCULATOR_CONFIG, calculatorData), ("json", JSON_CONFIG, jsonData)]:
+        dsl = DSL.makeDSL(config, algorithm="earley")
+        for count in [50, 100, 200]:
+            tokens = dsl.lexer.parse(data(count))
+            _, elapsed = timed(lambda: dsl.parser.parse(tokens), 3)
+            tracemalloc.start()
+            dsl.parser.parse(tokens)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print("{0:>12} {1:>9} {2:>9.3f} {3:>12}".format(name, len(tokens), elapsed, peak))
+    config = (JSON_CONFIG + CALCULATOR_CONFIG.replace("#dsl", "")) * 20
+    tokens = DSL._dslLexer.parse(config)
+    _, elapsed = timed(lambda: DSL._dslParser.parse(tokens), 3)
+    print("{0:>12} {1:>9} {2:>9.3f}".format("dsl", len(tokens), elapsed))
+    rules = grammarRules(300)
+    tokens = grammarTokens(rules, 200)
+    parser = Parser.EarleyParser("program", rules)
+    _, elapsed = timed(lambda: parser.parse(tokens), 3)
+    print("{0:>12} {1:>9} {2:>9.3f}".format("wide", len(tokens), elapsed))
+    print("{0:>12} {1:>9} {2:>9} {3:>12}".format("operands", "tokens", "chart(s)", "parse(s)"))
+    dsl = DSL.makeDSL(CALCULATOR_CONFIG, algorithm="earley")
+    for count in [1000, 2000, 4000, 8000, 16000]:
+        tokens = dsl.lexer.parse(calculatorData(count))
+        _, chartTime = timed(lambda: dsl.parser.parseForest(tokens))
+        _, parseTime = timed(lambda: dsl.parser.parse(tokens))
+        print("{0:>12} {1:>9} {2:>9.3f} {3:>12.3f}".format(count, len(tokens), chartTime, parseTime))
+
+def benchGLR():
+    print("{0:>12} {1:>9} {2:>9} {3:>9} {4:>9}".format("grammar", "tokens", "lalr(s)", "glr(s)", "earley(s)"))
+    for name, config, data in [("calculator", CALCULATOR_CONFIG, calculatorData), ("json", JSON_CONFIG, jsonData)]:
+        dsls = [DSL.makeDSL(config, algorithm=algorithm) for algorithm in ["lalr", "glr", "earley"]]
+        tokens = dsls[0].lexer.parse(data(400))
+        times = [timed(lambda: dsl.parser.parse(tokens), 3)[1] for dsl in dsls]
+        print("{0:>12} {1:>9} {2:>9.3f} {3:>9.3f} {4:>9.3f}".format(name, len(tokens), *times))
+    dsl = DSL.makeDSL(r"""#dsl
+        number ::= /[0-9]+/
+        E ::= E '+' E | E '*' E | number
+    """, algorithm="glr")
+    for count in [5, 10, 20, 40]:
+        tokens = dsl.lexer.parse(" + ".join(["1 * 2"] * count))
+        _, elapsed = timed(lambda: dsl.parser.parse(tokens))
+        print("{0:>12} {1:>9} {2:>9} {3:>9.3f}".format("ambiguous", len(tokens), "", elapsed))
+
+JSON_ACTIONS = {
+    "string": lambda tok: tok.value[1:-1],
+    "number": lambda tok: float(tok.value),
+    "true": lambda tok: True,
+    "false": lambda tok: False,
+    "null": lambda tok: None,
+    "kvPair": tuple,
+    "object": dict,
+    "array": list,
+}
+
+def jsonValue(ast):
+    if ast.name in JSON_ACTIONS and not hasattr(ast, "child"):
+        return JSON_ACTIONS[ast.name](ast)
+    return JSON_ACTIONS[ast.name](map(jsonValue, ast.child))
+
+def benchActions():
+    print("{0:>12} {1:>9} {2:>9} {3:>12}".format("mode", "tokens", "parse(s)", "peak(bytes)"))
+    dsl = DSL.makeDSL(JSON_CONFIG)
+    tokens = dsl.lexer.parse(jsonData(400))
+    for name, func in [("tree+walk", lambda: jsonValue(dsl.parser.parse(tokens))), ("actions", lambda: dsl.parser.parse(tokens, JSON_ACTIONS))]:
+        _, elapsed = timed(func, 5)
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print("{0:>12} {1:>9} {2:>9.3f} {3:>12}".format(name, len(tokens), elapsed, peak))
+
+def benchIncremental():
+    print("{0:>9} {1:>9} {2:>9}".format("tokens", "parse(s)", "edit(s)"))
+    dsl = DSL.makeDSL(JSON_CONFIG)
+    for count in [400, 1600, 6400]:
+        data = jsonData(count)
+        _, parsed = timed(lambda: dsl.parse(data))
+        state = dsl.parseIncremental(data)
+        offsets = [match.start() for match in re.finditer("[0-9]", data)][::37]
+        _, edited = timed(lambda: [dsl.edit(state, offset, 1, "7") for offset in offsets])
+        print("{0:>9} {1:>9.3f} {2:>9.5f}".format(len(state.tokens), parsed, edited / len(offsets)))
+
+def benchParseMany():
+    print("{0:>9} {1:>9} {2:>9}".format("workers", "docs", "parse(s)"))
+    dsl = DSL.makeDSL(JSON_CONFIG)
+    docs = [jsonData(20, seed) for seed in range(400)]
+    for workers in sorted({1, 2, os.cpu_count()}):
+        _, elapsed = timed(lambda: list(dsl.parseMany(docs, workers, 16)))
+        print("{0:>9} {1:>9} {2:>9.3f}".format(workers, len(docs), elapsed))
+
+def benchThreads():
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("{0:>9} {1:>9} {2:>9} {3:>9} {4:>12}".format("algorithm", "threads", "docs", "parse(s)", "docs/s") + ("" if gil else " (free-threaded)"))
+    docs = [jsonData(20, seed) for seed in range(200)]
+    for algorithm in ["lalr", "earley"]:
+        dsl = DSL.makeDSL(JSON_CONFIG, algorithm=algorithm)
+        for threads in sorted({1, 2, 4, os.cpu_count()}):
+            with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+                _, elapsed = timed(lambda: list(executor.map(dsl.parse, docs)))
+            print("{0:>9} {1:>9} {2:>9} {3:>9.3f} {4:>12.1f}".format(algorithm, threads, len(docs), elapsed, len(docs) / elapsed))
+
+def benchFused():
+    print("{0:>9} {1:>12} {2:>9} {3:>9} {4:>12}".format("algorithm", "mode", "tokens", "parse(s)", "peak(bytes)"))
+    data = jsonData(1600)
+    for algorithm in ["lalr", "glr"]:
+        dsl = DSL.makeDSL(JSON_CONFIG, algorithm=algorithm)
+        tokens = len(dsl.lexer.parse(data))
+        for name, func in [("list", lambda: dsl.parser.parse(dsl.lexer.parse(data), JSON_ACTIONS)), ("fused", lambda: dsl.parse(data))]:
+            dsl.actions = JSON_ACTIONS
+            _, elapsed = timed(func, 3)
+            tracemalloc.start()
+            func()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print("{0:>9} {1:>12} {2:>9} {3:>9.3f} {4:>12}".format(algorithm, name, tokens, elapsed, peak))
+
+BENCHMARKS = {
+    "minimize": benchMinimize,
+    "lexerBuild": benchLexerBuild,
+    "lex": benchLex,
+    "codegen": benchCodegen,
+    "parserBuild": benchParserBuild,
+    "grammarBuild": benchGrammarBuild,
+    "parse": benchParse,
+    "longList": benchLongList,
+    "earley": benchEarley,
+    "glr": benchGLR,
+    "actions": benchActions,
+    "incremental": benchIncremental,
+    "parseMany": benchParseMany,
+    "threads": benchThreads,
+    "fused": benchFused,
+    "tokenMemory": benchTokenMemory,
+}
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or BENCHMARKS.keys():
+        print("== " + name)
+        BENCHMARKS[name]()
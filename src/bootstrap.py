@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+import os
+import pprint
+import sys
+
+import Cache
+import DSL
+
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_dslTables.py")
+
+def generate():
+    DSL._buildBootstrap()
+    tables = dict((name, getattr(DSL, name).toTables()) for name in DSL.BOOTSTRAP)
+    return "".join([
+        "# Generated by bootstrap.py, do not edit.\n",
+        "# Run `python3 bootstrap.py` after changing the bootstrap grammars or the table format.\n\n",
+        "VERSION = {0!r}\n\n".format(Cache.version()),
+        "TABLES = {0}\n".format(pprint.pformat(tables, width=120, sort_dicts=False)),
+    ])
+
+def check():
+    try:
+        with open(OUTPUT, "r") as tableFile:
+            return tableFile.read() == generate()
+    except OSError:
+        return False
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--check"]:
+        if not check():
+            print("{0} is out of date, run `python3 bootstrap.py`".format(os.path.basename(OUTPUT)))
+            sys.exit(1)
+        print('YA!')
+    else:
+        with open(OUTPUT, "w") as tableFile:
+            tableFile.write(generate())
@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 
+import io, mmap, os, random, tempfile
 import Parser, Lexer
 from DSL import _lexerParser, _lexerLexer
 from DSL import _parserLexer, _parserParser
-from DSL import makeParser, makeLexer
+from DSL import makeParser, makeLexer, makeDSL
 
 lexerLexerConfig = r"""#dsl
     %keys ::= '%ignore' '%keys' '::='
@@ -63,4 +64,391 @@ realOutput = _parserParser.parse(_parserLexer.parse(parserParserConfig))
 testOutput = parserParser.parse(parserLexer.parse(parserParserConfig))
 assert(str(realOutput) == str(testOutput))
 
+jsonConfig = r"""#dsl
+    string ::= /"[^"\\]*(\\\\.[^"\\]*)*"/
+    number ::= /[0-9]+(\\.[0-9])?/
+    object ::= '{' (kvPair (',' kvPair)*)? '}'
+    kvPair ::= string ':' value
+    array ::= '[' (value (',' value)*)? ']'
+    value ::= string | number | object | array | 'true' | 'false' | 'null'
+    %ignore ::= '{' '}' '[' ']' ',' ':'
+    %expand ::= value
+"""
+jsonData = r'{"a": [1, 2.5, {"b": null}], "c": "x\"y", "d": [true, false]}'
+expected = str(makeDSL(jsonConfig).parse(jsonData))
+
+with tempfile.TemporaryDirectory() as cacheDir:
+    for _ in range(2):
+        assert(str(makeDSL(jsonConfig, cache=cacheDir).parse(jsonData)) == expected)
+        lexer = makeLexer(parserLexerConfig, cache=cacheDir)
+        parser = makeParser(parserParserConfig, cache=cacheDir)
+        assert(str(parser.parse(lexer.parse(parserParserConfig))) == str(realOutput))
+    assert(len(os.listdir(cacheDir)) == 3)
+    for name in os.listdir(cacheDir):
+        with open(os.path.join(cacheDir, name), "r+b") as cacheFile:
+            cacheFile.seek(-1, os.SEEK_END)
+            cacheFile.write(b"?")
+    assert(str(makeDSL(jsonConfig, cache=cacheDir).parse(jsonData)) == expected)
+
+unicodeDSL = makeDSL(r"""#dsl
+    word ::= /[a-zA-Zà-ÿ一-龥]+/
+    string ::= /"[^"]*"/
+    items ::= (word | string)*
+""", charset=None)
+unicodeTree = unicodeDSL.parse('hello 世界 "ünï 😀" café')
+assert([tok.value for tok in unicodeTree.child] == ['hello', '世界', '"ünï 😀"', 'café'])
+assert(len(unicodeDSL.lexer.alphabet) < 10)
+for backend in ["dfa", "re", "code"]:
+    catchAllLexer = Lexer.Lexer([Lexer.Rule("all", ".+")], charset=None, backend=backend)
+    assert([tok.value for tok in catchAllLexer.parse("a b\n€ c")] == ["a b\n€ c"])
+    commentLexer = makeLexer(r"""#dsl
+    comment ::= /#.*/
+    word ::= /[a-z]+/
+""", charset=None, backend=backend)
+    assert([tok.name for tok in commentLexer.parse("ab #x y\ncd")] == ["word", "comment"])
+
+jsonLexer = makeDSL(jsonConfig).lexer
+for data in [jsonData, parserParserConfig]:
+    lexer = jsonLexer if data is jsonData else parserLexer
+    expected = str(lexer.parse(data))
+    for size in [1, 2, 7, 64]:
+        chunks = [data[idx:idx+size] for idx in range(0, len(data), size)]
+        assert(str(list(lexer.iterparse(chunks))) == expected)
+        assert(str(list(lexer.iterparse(io.StringIO(data), size))) == expected)
+
+unicodeData = 'hello "世界" ' * 50 + 'end "café"'
+expected = [(tok.name, tok.value) for tok in unicodeDSL.lexer.parse(unicodeData)]
+rawData = unicodeData.encode("utf-8")
+with tempfile.TemporaryFile() as rawFile:
+    rawFile.write(rawData)
+    rawFile.flush()
+    mapped = mmap.mmap(rawFile.fileno(), 0, access=mmap.ACCESS_READ)
+    for buffer in [rawData, bytearray(rawData), memoryview(rawData), mapped]:
+        for size in [1, 5, 1 << 16]:
+            tokens = unicodeDSL.lexer.tokenizeBuffer(buffer, blockSize=size)
+            assert([(tok.name, tok.value) for tok in tokens] == expected)
+    tokens = unicodeDSL.lexer.parseBuffer(mapped)
+    assert(rawData[tokens[1].start:tokens[1].end] == '"世界"'.encode("utf-8"))
+    del tokens
+    mapped.close()
+
+tokenArray = jsonLexer.parseTokenArray(jsonData)
+assert(len(tokenArray) == len(jsonLexer.parse(jsonData)))
+assert(str(list(tokenArray)) == str(jsonLexer.parse(jsonData)))
+assert(str(makeDSL(jsonConfig).parser.parse(tokenArray)) == str(makeDSL(jsonConfig).parse(jsonData)))
+assert(str(parserParser.parse(parserLexer.parseTokenArray(parserParserConfig))) == str(realOutput))
+assert(str(_parserParser.parse(_parserLexer.parseTokenArray(parserParserConfig))) == str(realOutput))
+lines = "a\n  'b'\n\n    c"
+assert([(tok.line, tok.column) for tok in parserLexer.parse(lines)] == [(1, 1), (2, 3), (4, 5)])
+lineTokens = parserLexer.parseTokenArray(lines)
+assert([lineTokens.location(idx) for idx in range(len(lineTokens))] == [(1, 1), (2, 3), (4, 5)])
+
+def lexed(lexer, data):
+    tokens = []
+    try:
+        for tok in lexer.tokens(lexer.scanString(data)):
+            tokens.append((tok.name, tok.value, tok.line, tok.column))
+    except RuntimeError as err:
+        tokens.append(str(err))
+    return tokens
+
+keywordRules = [
+    Lexer.Rule("identifier", "[_a-zA-Z][_a-zA-Z0-9]*"),
+    Lexer.Rule("number", "[0-9]+(\\.[0-9]+)?"),
+    Lexer.Rule("comment", "#[^\n]*\n"),
+] + [Lexer.Rule(key, key, isRegex=False) for key in ["if", "in", "int", "=", "==", "=>", "é"]]
+rand = random.Random(1117)
+for lexer in [lexerLexer, parserLexer, jsonLexer, unicodeDSL.lexer, _lexerLexer, Lexer.Lexer(keywordRules, ignore=["comment"], charset=None)]:
+    dfaLexer = Lexer.Lexer(lexer.rules, lexer.strict, lexer.ignore, lexer.charset, backend="dfa")
+    codeLexer = Lexer.Lexer.fromTables(Lexer.Lexer(lexer.rules, lexer.strict, lexer.ignore, lexer.charset, backend="code").toTables())
+    reLexer = lexer if lexer is parserLexer else Lexer.Lexer(lexer.rules, lexer.strict, lexer.ignore, lexer.charset, backend="re")
+    assert((lexer.pattern is None) == (lexer is parserLexer) and dfaLexer.pattern is None)
+    samples = [jsonData, lexerLexerConfig, unicodeData, "if int inx == => =é 1.5 1. #x\n\u00a0\n x"]
+    samples += ["".join(rand.choice(" \n\\\"'/#%:=>{}[],.01aeintfx_é世\u00a0") for _ in range(rand.randint(0, 40))) for _ in range(300)]
+    for data in samples:
+        assert(lexed(reLexer, data) == lexed(dfaLexer, data) == lexed(codeLexer, data))
+for rules in [[("num", "[0-9]*")], [("x", "(ab)*")], [("opt", "a?"), ("ab", "(ab)*"), ("num", "[0-9]*"), ("xyz", "x(yz)*w?")]]:
+    rules = [Lexer.Rule(name, value) for name, value in rules]
+    nullableDfa, nullableCode = Lexer.Lexer(rules, backend="dfa"), Lexer.Lexer(rules, backend="code")
+    nullableSamples = ["12 3", "abab ab a", "xyzyzw x 7 aab"]
+    nullableSamples += ["".join(rand.choice(" abxyzw19") for _ in range(rand.randint(0, 20))) for _ in range(200)]
+    for data in nullableSamples:
+        assert(lexed(nullableDfa, data) == lexed(nullableCode, data))
+assert([tok.value for tok in Lexer.Lexer([Lexer.Rule("num", "[0-9]*")], backend="code").parse("12 3")] == ["12", "3"])
+dfaLexer = Lexer.Lexer(jsonLexer.rules, ignore=jsonLexer.ignore, backend="dfa")
+assert(str(list(jsonLexer.parseTokenArray(jsonData))) == str(dfaLexer.parse(jsonData)))
+with tempfile.TemporaryDirectory() as dumpDir:
+    codeLexer.dump(os.path.join(dumpDir, "frozen.py"))
+    namespace = {}
+    exec(open(os.path.join(dumpDir, "frozen.py")).read(), namespace)
+    assert(namespace["RULES"][0] == ("identifier", "[_a-zA-Z][_a-zA-Z0-9]*", True))
+    assert(namespace["match"]("intx = 1", 0, 8) == (1, 4) and namespace["match"]("int = 1", 0, 7) == (6, 3))
+assert(parserLexer.pattern is None and Lexer.Lexer([Lexer.Rule("a", "a|ab")]).pattern is None)
+
+lalrDSL = makeDSL(jsonConfig, algorithm="lalr")
+assert(isinstance(lalrDSL.parser, Parser.LALRParser) and isinstance(makeDSL(jsonConfig).parser, Parser.LALRParser))
+assert(lalrDSL.parser.states < makeDSL(jsonConfig, algorithm="lr1").parser.states)
+for algorithm in ["lr1", "earley"]:
+    assert(str(makeDSL(jsonConfig, algorithm=algorithm).parse(jsonData)) == str(lalrDSL.parse(jsonData)))
+packedParser = Parser.Parser.fromTables(lalrDSL.parser.toTables())
+assert(str(packedParser.parse(jsonLexer.parse(jsonData))) == str(lalrDSL.parse(jsonData)))
+for data in ['[1, 2', '[1 2]', '{"a"}', '']:
+    try:
+        packedParser.parse(jsonLexer.parse(data))
+        assert(False)
+    except RuntimeError as err:
+        assert(str(err) == "Can't parse token stream.")
+notLALR = r"""#dsl
+    S ::= 'a' A 'd' | 'b' B 'd' | 'a' B 'e' | 'b' A 'e'
+    A ::= 'c'
+    B ::= 'c'
+"""
+notLALRDSL = makeDSL(notLALR)
+assert(type(notLALRDSL.parser) is Parser.LR1Parser)
+assert([ch.name for ch in notLALRDSL.parse("b c e").child] == ["b", "A", "e"])
+
+nullableConfig = r"""#dsl
+    S ::= X items
+    X ::= 'q'?
+    items ::= head 'a'* 'b'* 'c'
+    head ::= 'h'?
+"""
+nullableDSLs = [makeDSL(nullableConfig, algorithm=algorithm) for algorithm in ["lalr", "lr1", "earley"]]
+for data in ["c", "a c", "q b c", "h a a b c"]:
+    assert(len(set(str(dsl.parse(data)) for dsl in nullableDSLs)) == 1)
+
+ambiguousDSL = makeDSL(r"""#dsl
+    E ::= E '+' E | 'a'
+""", algorithm="earley")
+ambiguousTokens = ambiguousDSL.lexer.parse("a + a + a")
+forest = ambiguousDSL.parser.parseForest(ambiguousTokens)
+assert(forest.isAmbiguous() and sorted(bounds for rule, bounds in forest.derivations("E", 0, 5)) == [(0, 1, 2, 5), (0, 3, 4, 5)])
+assert(not nullableDSLs[2].parser.parseForest(nullableDSLs[2].lexer.parse("h a c")).isAmbiguous())
+ambiguousDSL.parser.disambiguate = lambda name, start, end, derivations: max(derivations, key=lambda derivation: derivation[1][1])
+assert([ch.name for ch in ambiguousDSL.parse("a + a + a").child[0].child] == ["E", "+", "E"])
+cyclicParser = Parser.EarleyParser("S", [Parser.Rule("S", ["A"]), Parser.Rule("A", ["S"]), Parser.Rule("A", ["a"])])
+cyclicParser.disambiguate = lambda name, start, end, derivations: derivations[-1]
+assert(str(cyclicParser.parse([Lexer.Token("a", "a")])).split() == ["S", "A", "S", "A", "(a:a)"])
+
+listConfig = r"""#dsl
+    number ::= /[0-9]+/
+    items ::= item*
+    item ::= number | '(' item+ ')'
+"""
+listData = "1 (2 3) " * 3000 + "(4 (5))"
+assert(str(makeDSL(listConfig, algorithm="earley").parse(listData)) == str(makeDSL(listConfig, algorithm="lalr").parse(listData)))
+
+nullableCycleDSL = makeDSL(r"""#dsl
+    S ::= E E 'c' E
+    E ::= $ | F
+    F ::= E | 'f'
+""", algorithm="earley")
+assert(str(nullableCycleDSL.parse("c")).split() == ["S", "E", "E", "(c:c)", "E"])
+assert(str(nullableCycleDSL.parse("f f c f")).split().count("(f:f)") == 3)
+
+glrDSL = makeDSL(jsonConfig, algorithm="glr")
+assert(glrDSL.parser.ALGORITHM == "glr" and lalrDSL.parser.ALGORITHM == "lalr" and len(glrDSL.parser.conflicts) == 0)
+assert(str(glrDSL.parse(jsonData)) == str(lalrDSL.parse(jsonData)))
+lalrBuild = Parser.LALRParser.build
+Parser.LALRParser.build = lambda parser: {}["missing"]
+try:
+    makeDSL(jsonConfig, cache=False)
+    assert(False)
+except KeyError:
+    pass
+finally:
+    Parser.LALRParser.build = lalrBuild
+assert([ch.name for ch in makeDSL(notLALR, algorithm="glr").parse("b c e").child] == ["b", "A", "e"])
+for data in ["c", "a c", "q b c", "h a a b c"]:
+    assert(str(makeDSL(nullableConfig, algorithm="glr").parse(data)) == str(nullableDSLs[0].parse(data)))
+assert(str(makeDSL(listConfig, algorithm="glr").parse(listData)) == str(makeDSL(listConfig, algorithm="lalr").parse(listData)))
+ambiguousGLR = makeDSL(r"""#dsl
+    E ::= E '+' E | 'a'
+""")
+assert(type(ambiguousGLR.parser) is Parser.GLRParser and len(ambiguousGLR.parser.conflicts) > 0)
+assert(str(ambiguousGLR.parse("a + a + a")).split().count("E") == 5)
+packedGLR = Parser.Parser.fromTables(ambiguousGLR.parser.toTables())
+assert(str(packedGLR.parse(ambiguousGLR.lexer.parse("a + a + a + a"))) == str(ambiguousGLR.parse("a + a + a + a")))
+for data in ["a +", "+ a", "a a"]:
+    try:
+        packedGLR.parse(ambiguousGLR.lexer.parse(data))
+        assert(False)
+    except RuntimeError as err:
+        assert(str(err) == "Can't parse token stream.")
+cyclicGLR = Parser.GLRParser("S", [Parser.Rule("S", ["A"]), Parser.Rule("A", ["S"]), Parser.Rule("A", ["a"])])
+assert(str(cyclicGLR.parse([Lexer.Token("a", "a")])).split()[-1] == "(a:a)")
+glrCycleDSL = makeDSL(r"""#dsl
+    S ::= E E 'c' E
+    E ::= $ | F
+    F ::= E | 'f'
+""", algorithm="glr")
+assert(str(glrCycleDSL.parse("f f c f")).split().count("(f:f)") == 3)
+
+reduceConfig = r"""#dsl
+    number ::= /[0-9]+/
+    S ::= E noise? ';'
+    E ::= T ('+' T)*
+    T ::= number | '(' E ')' | '-' T
+    noise ::= '!' number
+    %ignore ::= noise '(' ')' '+' ';'
+    %expandSingle ::= E
+"""
+reduceDSLs = [makeDSL(reduceConfig, algorithm=algorithm) for algorithm in ["lalr", "glr", "earley"]]
+for data in ["1 ;", "1 + (2) + - 3 ! 4 ;", "((1 + 2)) ;"]:
+    assert(len(set(str(dsl.parse(data)) for dsl in reduceDSLs)) == 1)
+assert(str(reduceDSLs[0].parse("((1 + 2)) ;")).split() == ["S", "T", "T", "E", "T", "(number:1)", "T", "(number:2)"])
+for dsl in reduceDSLs:
+    try:
+        makeDSL(reduceConfig.replace("%ignore ::=", "%expand ::= S E\n    %ignore ::="), algorithm=dsl.parser.ALGORITHM).parse("1 + 2 ;")
+        assert(False)
+    except RuntimeError as err:
+        assert(str(err) == "The simplified AST is not a tree.")
+deepDSL = makeDSL(r"""#dsl
+    items ::= 'a' items | $
+""")
+deepNode = deepDSL.parse("a " * 20000)
+for _ in range(20000):
+    assert(deepNode.name == "items" and deepNode.child[0].value == "a")
+    deepNode = deepNode.child[1]
+assert(deepNode.name == "items" and deepNode.child == [])
+listDSL = makeDSL(r"""#dsl
+    number ::= /[0-9]+/
+    items ::= number*
+""")
+assert([tok.value for tok in listDSL.parse(" ".join(map(str, range(30000)))).child] == list(map(str, range(30000))))
+
+jsonActions = {
+    "string": lambda tok: tok.value[1:-1],
+    "number": lambda tok: float(tok.value),
+    "true": lambda tok: True,
+    "false": lambda tok: False,
+    "null": lambda tok: None,
+    "kvPair": tuple,
+    "object": dict,
+    "array": list,
+}
+for algorithm in ["lalr", "glr", "earley"]:
+    actionDSL = makeDSL(jsonConfig, algorithm=algorithm, actions=jsonActions)
+    assert(actionDSL.parse(jsonData) == {"a": [1.0, 2.5, {"b": None}], "c": 'x\\"y', "d": [True, False]})
+    assert(actionDSL.parse('{"e": [[], [1]]}') == {"e": [[], [1.0]]})
+    assert(str(actionDSL.parser.parse(actionDSL.lexer.parse(jsonData))) == str(lalrDSL.parse(jsonData)))
+calcActions = {
+    "number": lambda tok: int(tok.value),
+    "E": sum,
+    "T": lambda children: -children[1] if len(children) == 2 else children[0],
+    "+": lambda tok: 1 / 0,
+}
+calcConfig = r"""#dsl
+    number ::= /[0-9]+/
+    E ::= T ('+' T)*
+    T ::= number | '(' E ')' | '-' T
+    %ignore ::= '(' ')' '+'
+"""
+for algorithm in ["lalr", "glr", "earley"]:
+    assert(makeDSL(calcConfig, algorithm=algorithm, actions=calcActions).parse("1 + (2 + - 3) + - - 4") == 4)
+
+def checkTokens(tokens, expected):
+    assert(list(tokens.ids) == list(expected.ids))
+    assert(list(tokens.starts) == list(expected.starts) and list(tokens.ends) == list(expected.ends))
+    assert([(tok.value, tok.line, tok.column) for tok in tokens] == [(tok.value, tok.line, tok.column) for tok in expected])
+for source in [jsonData, jsonData.encode("utf-8")]:
+    incLexer = makeDSL(jsonConfig).lexer
+    assert(incLexer.lookahead == 2)
+    incTokens = incLexer.parseTokenArray(source)
+    for offset, deleted, inserted in [(7, 1, "10, 11"), (2, 1, "bb"), (0, 0, " \n"), (56, 4, "null")]:
+        inserted = inserted if isinstance(source, str) else inserted.encode("utf-8")
+        source = source[:offset] + inserted + source[offset + deleted:]
+        oldLength = len(incTokens)
+        first, removed, added = incLexer.relex(incTokens, offset, deleted, inserted)
+        assert(len(incTokens) == oldLength + added - removed)
+        checkTokens(incTokens, incLexer.parseTokenArray(source))
+assert(makeLexer(r"""#dsl
+    %keys ::= 'in' 'interface'
+""").lookahead == 7)
+for algorithm in ["lalr", "glr", "earley"]:
+    incDSL = makeDSL(jsonConfig, algorithm=algorithm, actions=jsonActions if algorithm == "glr" else None)
+    source = jsonData
+    incState = incDSL.parseIncremental(source)
+    edits = [(7, 1, "[3, {}]"), (2, 1, "z"), (0, 0, "  "), (30, 0, ', "k": 1 '), (10, 0, "]"), (10, 1, ""), (20, 4, "")]
+    edits += [(rand.randrange(40), rand.randrange(3), rand.choice(["1", ",", " ", "[", "]"])) for _ in range(100)]
+    for offset, deleted, inserted in edits:
+        source = source[:offset] + inserted + source[offset + deleted:]
+        try:
+            expected = str(incDSL.parse(source))
+        except RuntimeError:
+            expected = None
+        try:
+            assert(str(incDSL.edit(incState, offset, deleted, inserted).tree) == expected)
+        except RuntimeError:
+            assert(expected is None and incState.tree is None)
+        if expected is not None:
+            checkTokens(incState.tokens, incDSL.lexer.parseTokenArray(source))
+    def leafLocations(tree):
+        leaves, stack = [], [tree]
+        while len(stack) > 0:
+            node = stack.pop()
+            if isinstance(node, Parser.Node):
+                stack.extend(reversed(node.child))
+            else:
+                leaves.append((node.value, node.line, node.column))
+        return leaves
+    linesDSL = makeDSL(jsonConfig, algorithm=algorithm)
+    linesState = linesDSL.parseIncremental('{"a": 1,\n "b": 2}')
+    linesDSL.edit(linesState, 0, 0, "\n\n")
+    linesDSL.edit(linesState, 11, 0, "  ")
+    assert(leafLocations(linesState.tree) == leafLocations(linesDSL.parse('\n\n{"a": 1,\n   "b": 2}')))
+    assert(leafLocations(linesState.tree)[0] == ('"a"', 3, 2))
+
+import pickle
+for algorithm in ["lalr", "glr", "earley"]:
+    pickledDSL = pickle.loads(pickle.dumps(makeDSL(jsonConfig, algorithm=algorithm)))
+    assert(str(pickledDSL.parse(jsonData)) == str(lalrDSL.parse(jsonData)))
+tokenDSL = makeDSL(jsonConfig)
+assert(str(pickle.loads(pickle.dumps(tokenDSL.parser.parse(tokenDSL.lexer.parseTokenArray(jsonData.encode("utf-8")))))) == str(lalrDSL.parse(jsonData)))
+import linecache
+codeLexer = makeDSL(jsonConfig, backend="code").lexer
+lexerEntries = [name for name in linecache.cache if name.startswith("<lexer ")]
+for _ in range(3):
+    assert(str(pickle.loads(pickle.dumps(codeLexer)).parse(jsonData)) == str(codeLexer.parse(jsonData)))
+assert([name for name in linecache.cache if name.startswith("<lexer ")] == lexerEntries)
+manyData = ['{"a": [%d]}' % idx for idx in range(40)]
+manyExpected = [str(lalrDSL.parse(data)) for data in manyData]
+for workers in [1, 2]:
+    assert([str(tree) for tree in lalrDSL.parseMany(manyData, workers, 4)] == manyExpected)
+    assert(sorted((idx, str(tree)) for idx, tree in lalrDSL.parseMany(manyData, workers, ordered=False)) == list(enumerate(manyExpected)))
+
+import concurrent.futures, sys
+switchInterval = sys.getswitchinterval()
+sys.setswitchinterval(1e-6)
+threadData = ['{"a": [%d, {"b": "%s"}], "c": [%s]}' % (idx, "x" * idx, ", ".join(["true"] * idx)) for idx in range(60)]
+for backend in ["dfa", "re", "code"]:
+    for algorithm in ["lalr", "glr", "earley"]:
+        threadDSL = makeDSL(jsonConfig, backend=backend, algorithm=algorithm)
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            threadTrees = list(executor.map(lambda data: str(threadDSL.parse(data)), threadData * 4))
+        assert(threadTrees == [str(lalrDSL.parse(data)) for data in threadData * 4])
+sys.setswitchinterval(switchInterval)
+
+def countedTokens(tokens, consumed):
+    for tok in tokens:
+        consumed.append(tok)
+        yield tok
+for algorithm in ["lalr", "glr", "earley"]:
+    fusedDSL = makeDSL(jsonConfig, algorithm=algorithm)
+    assert(str(fusedDSL.parser.parse(fusedDSL.lexer.iterparse(io.StringIO(jsonData), 7))) == str(lalrDSL.parse(jsonData)))
+    try:
+        fusedDSL.parse('{"a": ] ' + "1 " * 100 + "@")
+        assert(False)
+    except RuntimeError as err:
+        assert(str(err) == ("Can't parse string at line 1, column 209" if algorithm == "earley" else "Can't parse token stream."))
+consumed = []
+try:
+    lalrDSL.parser.parse(countedTokens(lalrDSL.lexer.iterparse(io.StringIO('{"a": ] ' + "1 " * 100)), consumed))
+    assert(False)
+except RuntimeError as err:
+    assert(len(consumed) == 4)
+
+import bootstrap
+assert(bootstrap.check())
+
 print('YA!')